@@ -2,6 +2,7 @@ from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy import text
 
 from alembic import context
 
@@ -22,7 +23,8 @@ config = context.config
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
-if config.config_file_name is not None:
+# (Skipped when run in-process by a caller that has already set up logging.)
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # Get database URL from config
@@ -78,6 +80,18 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            # Fail fast instead of waiting indefinitely behind another lock holder
+            connection.execute(
+                text("SELECT set_config('lock_timeout', :lock_timeout, false), "
+                     "set_config('statement_timeout', :statement_timeout, false)"),
+                {
+                    "lock_timeout": app_config.migration_lock_timeout,
+                    "statement_timeout": app_config.migration_statement_timeout,
+                }
+            )
+            connection.commit()
+
         context.configure(
             connection=connection, target_metadata=target_metadata
         )
@@ -0,0 +1,29 @@
+"""Add keyword search version for optimistic locking
+
+Revision ID: 004
+Revises: ee0b10243811
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = 'ee0b10243811'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add row version to keyword_searches (existing rows start at 0)
+    op.add_column(
+        'keyword_searches',
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('keyword_searches', 'version')
@@ -2,6 +2,7 @@
 FastAPI application for Rixly.
 """
 
+import asyncio
 import os
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -13,6 +14,8 @@ from core.config import get_config
 from core.logger import get_logger, setup_logging
 from modules.scheduler.scheduler import RixlyScheduler
 from modules.database.storage import LeadStorage
+from modules.reddit.api_client import get_reddit_api_client
+from modules.webhooks.sender import get_webhook_sender
 from api.routes import keyword_searches, leads, utilities, metrics
 from api.middleware.error_handler import (
     global_exception_handler,
@@ -290,6 +293,11 @@ async def startup_event():
         scheduler = get_scheduler()
         scheduler.start()
         logger.info("Scheduler started")
+    
+    # Open the Reddit API connection in the background so the first scrape
+    # doesn't pay for it (task kept on app.state so it isn't garbage collected)
+    if config.reddit_client_id and config.reddit_client_secret:
+        app.state.reddit_warmup = asyncio.create_task(get_reddit_api_client().warmup())
 
 
 @app.on_event("shutdown")
@@ -302,4 +310,10 @@ async def shutdown_event():
     if _scheduler and _scheduler.is_running():
         _scheduler.stop()
         logger.info("Scheduler stopped")
+    
+    # Close the shared Reddit API connection pool
+    await get_reddit_api_client().close()
+    
+    # Send queued lead webhooks before exiting
+    await get_webhook_sender().close()
 
@@ -11,7 +11,6 @@ from slowapi.util import get_remote_address
 
 from core.logger import get_logger
 from core.processor import process_keyword_search
-from core.state import KeywordSearchState
 from modules.database.storage import LeadStorage
 from modules.keywords.manager import KeywordSearchManager
 from modules.jobs.tracker import get_job_tracker
@@ -315,30 +314,7 @@ async def trigger_scrape(
     
     # Update database with job status
     try:
-        search_model = storage.get_keyword_search(search_id)
-        if search_model:
-            search_state = KeywordSearchState(
-                id=search_model.id,
-                name=search_model.name,
-                keywords=search_model.keywords,
-                patterns=search_model.patterns,
-                platforms=search_model.platforms,
-                reddit_config=search_model.reddit_config,
-                linkedin_config=search_model.linkedin_config,
-                twitter_config=search_model.twitter_config,
-                scraping_mode=search_model.scraping_mode,
-                scraping_interval=search_model.scraping_interval,
-                enabled=search_model.enabled,
-                created_at=search_model.created_at,
-                updated_at=datetime.utcnow(),
-                last_scrape_at=search_model.last_scrape_at,
-                next_scrape_at=search_model.next_scrape_at,
-                scraping_status="running",
-                scraping_started_at=datetime.utcnow(),
-                scraping_completed_at=None,
-                scraping_error=None
-            )
-            storage.save_keyword_search(search_state)
+        storage.update_scrape_status(search_id, "running", started_at=datetime.utcnow())
     except Exception as e:
         logger.warning("Failed to update job status in database", search_id=search_id, error=str(e))
     
@@ -352,30 +328,7 @@ async def trigger_scrape(
         
         # Update database with completion
         try:
-            search_model = storage.get_keyword_search(search_id)
-            if search_model:
-                search_state = KeywordSearchState(
-                    id=search_model.id,
-                    name=search_model.name,
-                    keywords=search_model.keywords,
-                    patterns=search_model.patterns,
-                    platforms=search_model.platforms,
-                    reddit_config=search_model.reddit_config,
-                    linkedin_config=search_model.linkedin_config,
-                    twitter_config=search_model.twitter_config,
-                    scraping_mode=search_model.scraping_mode,
-                    scraping_interval=search_model.scraping_interval,
-                    enabled=search_model.enabled,
-                    created_at=search_model.created_at,
-                    updated_at=datetime.utcnow(),
-                    last_scrape_at=search_model.last_scrape_at,
-                    next_scrape_at=search_model.next_scrape_at,
-                    scraping_status="completed",
-                    scraping_started_at=search_model.scraping_started_at,
-                    scraping_completed_at=datetime.utcnow(),
-                    scraping_error=None
-                )
-                storage.save_keyword_search(search_state)
+            storage.update_scrape_status(search_id, "completed", completed_at=datetime.utcnow())
         except Exception as e:
             logger.warning("Failed to update completion status in database", search_id=search_id, error=str(e))
         
@@ -388,30 +341,12 @@ async def trigger_scrape(
         
         # Update database with failure
         try:
-            search_model = storage.get_keyword_search(search_id)
-            if search_model:
-                search_state = KeywordSearchState(
-                    id=search_model.id,
-                    name=search_model.name,
-                    keywords=search_model.keywords,
-                    patterns=search_model.patterns,
-                    platforms=search_model.platforms,
-                    reddit_config=search_model.reddit_config,
-                    linkedin_config=search_model.linkedin_config,
-                    twitter_config=search_model.twitter_config,
-                    scraping_mode=search_model.scraping_mode,
-                    scraping_interval=search_model.scraping_interval,
-                    enabled=search_model.enabled,
-                    created_at=search_model.created_at,
-                    updated_at=datetime.utcnow(),
-                    last_scrape_at=search_model.last_scrape_at,
-                    next_scrape_at=search_model.next_scrape_at,
-                    scraping_status="failed",
-                    scraping_started_at=search_model.scraping_started_at,
-                    scraping_completed_at=datetime.utcnow(),
-                    scraping_error=error_msg
-                )
-                storage.save_keyword_search(search_state)
+            storage.update_scrape_status(
+                search_id,
+                "failed",
+                completed_at=datetime.utcnow(),
+                error=error_msg
+            )
         except Exception as db_error:
             logger.warning("Failed to update failure status in database", search_id=search_id, error=str(db_error))
         
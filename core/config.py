@@ -22,6 +22,10 @@ class Config(BaseSettings):
     
     # API Configuration
     api_key: str = Field(default="dev_api_key")
+    api_workers: int = Field(
+        default=1,
+        description="Uvicorn worker processes in production (keep 1 if the API runs the built-in scheduler)"
+    )
     
     # Reddit API
     reddit_client_id: str = Field(default="")
@@ -42,6 +46,14 @@ class Config(BaseSettings):
     database_name: str = Field(default="rixly", description="Database name")
     database_user: str = Field(default="rixly", description="Database user")
     database_password: str = Field(default="rixly", description="Database password")
+    migration_lock_timeout: str = Field(
+        default="5s",
+        description="PostgreSQL lock_timeout for migrations, so a blocked ALTER fails instead of stalling startup"
+    )
+    migration_statement_timeout: str = Field(
+        default="30min",
+        description="PostgreSQL statement_timeout for migrations"
+    )
     
     @property
     def database_url_from_parts(self) -> str:
@@ -56,6 +68,10 @@ class Config(BaseSettings):
     # Scheduler
     scheduler_enabled: bool = Field(default=True)
     scheduler_check_interval: int = Field(default=60)  # seconds
+    scheduler_max_concurrent_searches: int = Field(
+        default=4,
+        description="Maximum due keyword searches processed concurrently per scheduler check"
+    )
     
     # Job tracking
     job_cooldown_minutes: int = Field(default=5, description="Minimum minutes between scrapes for same search")
@@ -69,6 +85,14 @@ class Config(BaseSettings):
         default=60,
         description="Maximum Reddit API requests per minute (global limit)"
     )
+    reddit_max_concurrent_subreddits: int = Field(
+        default=4,
+        description="Maximum subreddits scraped concurrently per search"
+    )
+    reddit_max_concurrent_comment_fetches: int = Field(
+        default=8,
+        description="Maximum post comment fetches in flight concurrently per search"
+    )
     
     # Reddit Connection Settings
     reddit_connection_timeout: float = Field(
@@ -83,6 +107,14 @@ class Config(BaseSettings):
         default=2.0,
         description="Initial delay in seconds between retry attempts (exponential backoff)"
     )
+    reddit_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds scraped listings/comments are reused across searches (0 disables)"
+    )
+    reddit_cache_backend: str = Field(
+        default="memory",
+        description="Where scraped listings/comments are cached: memory (per process) or redis (shared)"
+    )
     
     # Search Limits (prevent accidental large scrapes)
     reddit_max_posts_per_search: int = Field(
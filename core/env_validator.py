@@ -4,6 +4,7 @@ Validates that all required environment variables are set.
 """
 
 import os
+import re
 import sys
 from typing import Dict, List, Optional, Tuple
 
@@ -22,6 +23,7 @@ REQUIRED_ENV_VARS = {
 # Optional but recommended environment variables
 OPTIONAL_ENV_VARS = {
     "API_KEY": "API authentication key (defaults to 'dev_api_key')",
+    "API_WORKERS": "Uvicorn worker processes in production (defaults to 1)",
     "REDDIT_USER_AGENT": "Reddit user agent string (defaults to 'rixly/1.0')",
     "DATABASE_URL": "PostgreSQL database URL (or use DATABASE_HOST, DATABASE_USER, etc.)",
     "DATABASE_HOST": "Database host (defaults to 'localhost')",
@@ -29,17 +31,24 @@ OPTIONAL_ENV_VARS = {
     "DATABASE_NAME": "Database name (defaults to 'rixly')",
     "DATABASE_USER": "Database user (defaults to 'rixly')",
     "DATABASE_PASSWORD": "Database password (defaults to 'rixly')",
+    "MIGRATION_LOCK_TIMEOUT": "PostgreSQL lock_timeout for migrations (defaults to '5s')",
+    "MIGRATION_STATEMENT_TIMEOUT": "PostgreSQL statement_timeout for migrations (defaults to '30min')",
     "LOG_LEVEL": "Logging level: DEBUG, INFO, WARNING, ERROR, CRITICAL (defaults to 'INFO')",
     "LOG_FILE": "Log file path (defaults to 'logs/app.log')",
     "ENVIRONMENT": "Environment: development or production (defaults to 'development')",
     "SCHEDULER_ENABLED": "Enable built-in scheduler in API service (defaults to 'false' - use separate scheduler service with --profile scheduler)",
     "SCHEDULER_CHECK_INTERVAL": "Scheduler check interval in seconds (defaults to 60)",
+    "SCHEDULER_MAX_CONCURRENT_SEARCHES": "Max due searches processed concurrently per scheduler check (defaults to 4)",
     "JOB_COOLDOWN_MINUTES": "Job cooldown in minutes (defaults to 5)",
     "REDDIT_RATE_LIMIT_DELAY": "Reddit rate limit delay in seconds (defaults to 1.0)",
     "REDDIT_MAX_REQUESTS_PER_MINUTE": "Max Reddit requests per minute (defaults to 60)",
+    "REDDIT_MAX_CONCURRENT_SUBREDDITS": "Max subreddits scraped concurrently per search (defaults to 4)",
+    "REDDIT_MAX_CONCURRENT_COMMENT_FETCHES": "Max post comment fetches in flight per search (defaults to 8)",
     "REDDIT_CONNECTION_TIMEOUT": "Reddit connection timeout in seconds (defaults to 30.0)",
     "REDDIT_RETRY_ATTEMPTS": "Number of retry attempts for transient failures (defaults to 3)",
     "REDDIT_RETRY_DELAY": "Initial retry delay in seconds, exponential backoff (defaults to 2.0)",
+    "REDDIT_CACHE_TTL": "Seconds scraped listings/comments are reused across searches, 0 disables (defaults to 60.0)",
+    "REDDIT_CACHE_BACKEND": "Reddit response cache backend: memory or redis (defaults to memory)",
     "REDDIT_MAX_POSTS_PER_SEARCH": "Max posts per search (defaults to 1000)",
     "REDDIT_MAX_COMMENTS_PER_POST": "Max comments per post (defaults to 500)",
     "VPN_ENABLED": "Enable VPN for scraping (defaults to 'false')",
@@ -47,6 +56,10 @@ OPTIONAL_ENV_VARS = {
 }
 
 
+# Password part of a database URL (user:password@host)
+DATABASE_URL_PASSWORD_PATTERN = re.compile(r'(://[^:]+:)([^@]+)(@)')
+
+
 class EnvValidationError(Exception):
     """Raised when environment validation fails."""
     pass
@@ -171,8 +184,7 @@ def print_validation_report(verbose: bool = False) -> None:
         print(f"  ✓ SET      DATABASE_URL - Using full database URL")
         if verbose:
             # Mask password in URL
-            import re
-            masked_url = re.sub(r'(://[^:]+:)([^@]+)(@)', r'\1***MASKED***\3', database_url)
+            masked_url = DATABASE_URL_PASSWORD_PATTERN.sub(r'\1***MASKED***\3', database_url)
             print(f"              Value: {masked_url}")
     else:
         print(f"  ⚠ USING    DATABASE_URL - Using individual parts (with defaults)")
@@ -198,10 +210,11 @@ def print_validation_report(verbose: bool = False) -> None:
                 print(f"              Value: {masked}")
         print()
     
-    # Summary
+    # Summary (same result as validate_all, reusing the checks above)
     print("Validation Summary:")
     print("-" * 60)
-    is_valid, issues = validate_all()
+    is_valid = req_valid and db_valid
+    issues = req_missing + db_issues
     
     if is_valid:
         print("  ✓ All required environment variables are set!")
@@ -7,8 +7,9 @@ and automatic sensitive data masking.
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from logging.handlers import RotatingFileHandler
 
 import structlog
@@ -16,6 +17,26 @@ import structlog
 from core.log_masking import mask_log_data
 
 
+class Lazy:
+    """
+    Log value computed only if the event is emitted.
+    
+    Example:
+        logger.info("Found searches", search_ids=Lazy(lambda: [s.id for s in searches]))
+    """
+    
+    __slots__ = ("func",)
+    
+    def __init__(self, func: Callable[[], Any]):
+        """
+        Initialize lazy value.
+        
+        Args:
+            func: Zero-argument callable returning the value to log
+        """
+        self.func = func
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -92,6 +113,19 @@ def setup_logging(
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     
+    # Custom processor to evaluate lazy values
+    def resolve_lazy_values(logger, method_name, event_dict):
+        """
+        Resolve values wrapped in Lazy (other values are left unchanged).
+        
+        Processors only run for events that pass the level filter, so
+        expensive Lazy values are never built for dropped events.
+        """
+        return {
+            key: value.func() if isinstance(value, Lazy) else value
+            for key, value in event_dict.items()
+        }
+    
     # Custom processor to mask sensitive data
     def mask_sensitive_data(logger, method_name, event_dict):
         """Mask sensitive data in log events."""
@@ -103,6 +137,7 @@ def setup_logging(
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
+            resolve_lazy_values,  # After merging so bound context values resolve too
             structlog.processors.add_log_level,
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
@@ -120,10 +155,15 @@ def setup_logging(
     )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> structlog.BoundLogger:
     """
     Get a logger instance.
     
+    Loggers are lazy proxies that pick up the configuration current at each
+    call, so one instance per name is shared (including ones created before
+    setup_logging).
+    
     Args:
         name: Logger name (usually __name__)
         
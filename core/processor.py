@@ -13,7 +13,7 @@ from modules.platforms.processor import PlatformProcessor
 from modules.reddit.filters import RedditFilter
 from modules.reddit.parser import RedditParser
 from modules.analyzer.lead_analyzer import LeadAnalyzer
-from modules.database.storage import LeadStorage
+from modules.database.storage import LeadStorage, StaleStateError
 from modules.keywords.manager import KeywordSearchManager
 from modules.webhooks.sender import get_webhook_sender
 
@@ -145,8 +145,8 @@ async def process_keyword_search(
             all_comments.extend(comments)
         
         # Step 2: Parse content
-        parsed_posts = [parser.parse_post(post) for post in all_posts]
-        parsed_comments = [parser.parse_comment(comment) for comment in all_comments]
+        parsed_posts = parser.parse_posts(all_posts)
+        parsed_comments = parser.parse_comments(all_comments)
         
         # Step 3: Filter content
         filtered_posts = filter_module.filter_combined(
@@ -288,7 +288,11 @@ async def process_keyword_search(
             )
             keyword_search.next_scrape_at = next_scrape
         
-        storage.save_keyword_search(keyword_search)
+        try:
+            storage.save_keyword_search(keyword_search)
+        except StaleStateError:
+            # Edited while scraping; re-apply only the scrape tracking fields
+            manager.mark_scraped(keyword_search.id)
         
         processing_time = time.time() - start_time
         
@@ -40,6 +40,9 @@ class KeywordSearchState:
     scraping_completed_at: Optional[datetime] = None
     scraping_error: Optional[str] = None
     
+    # Row version this state was read at (optimistic locking)
+    version: int = 0
+    
     # Timestamps
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
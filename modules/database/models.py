@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
-    Boolean, Column, DateTime, Float, 
+    Boolean, Column, DateTime, Float, Integer,
     String, Text, JSON, ForeignKey, Index
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -50,6 +50,9 @@ class KeywordSearch(Base):
     scraping_completed_at = Column(DateTime, nullable=True)
     scraping_error = Column(Text, nullable=True)
     
+    # Optimistic locking (bumped on every ORM update, checked in the UPDATE's WHERE)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -57,6 +60,8 @@ class KeywordSearch(Base):
     # Relationship
     leads = relationship("Lead", back_populates="keyword_search", cascade="all, delete-orphan")
     
+    __mapper_args__ = {"version_id_col": version}
+    
     # Indexes
     __table_args__ = (
         Index('idx_keyword_search_enabled', 'enabled'),
@@ -8,8 +8,9 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import create_engine, desc, and_, or_
+from sqlalchemy import create_engine, desc, and_, or_, func, case
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm.exc import StaleDataError
 
 from core.config import get_config
 from core.logger import get_logger
@@ -19,6 +20,11 @@ from modules.database.models import Base, KeywordSearch, Lead, ScrapedContent, L
 logger = get_logger(__name__)
 
 
+class StaleStateError(Exception):
+    """Raised when saving a keyword search that was modified since it was read."""
+    pass
+
+
 class LeadStorage:
     """Handles database operations for leads and keyword searches."""
     
@@ -61,11 +67,18 @@ class LeadStorage:
         """
         Save or update a keyword search.
         
+        Updates are compare-and-swap on the row version: the state must have
+        been read at the current version, and the version is bumped on save
+        (search_state.version is updated to match).
+        
         Args:
             search_state: Keyword search state
             
         Returns:
             Saved KeywordSearch model
+            
+        Raises:
+            StaleStateError: If the search was modified since search_state was read
         """
         session = self.get_session()
         try:
@@ -73,6 +86,12 @@ class LeadStorage:
             existing = session.query(KeywordSearch).filter_by(id=search_state.id).first()
             
             if existing:
+                if existing.version != search_state.version:
+                    raise StaleStateError(
+                        f"Keyword search {search_state.id} was modified "
+                        f"(version {existing.version}, expected {search_state.version})"
+                    )
+                
                 # Update
                 existing.name = search_state.name
                 existing.keywords = search_state.keywords
@@ -121,13 +140,65 @@ class LeadStorage:
                 session.add(existing)
                 logger.info("Created keyword search", search_id=search_state.id)
             
-            session.commit()
+            try:
+                # The UPDATE is guarded by the version read above
+                session.commit()
+            except StaleDataError as e:
+                session.rollback()
+                raise StaleStateError(
+                    f"Keyword search {search_state.id} was modified concurrently"
+                ) from e
+            
             session.refresh(existing)
+            search_state.version = existing.version
             return existing
             
         finally:
             session.close()
     
+    def update_scrape_status(
+        self,
+        search_id: str,
+        status: str,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """
+        Update a keyword search's scraping status with a single UPDATE.
+        
+        Only the status columns are written, so concurrent edits to the rest
+        of the search are not overwritten.
+        
+        Args:
+            search_id: Keyword search ID
+            status: New scraping status ("running", "completed", "failed")
+            started_at: Scraping start time (kept unchanged if None)
+            completed_at: Scraping completion time
+            error: Scraping error message
+            
+        Returns:
+            True if the search exists
+        """
+        session = self.get_session()
+        try:
+            updated = session.query(KeywordSearch).filter_by(id=search_id).update(
+                {
+                    KeywordSearch.scraping_status: status,
+                    KeywordSearch.scraping_started_at: func.coalesce(
+                        started_at, KeywordSearch.scraping_started_at
+                    ),
+                    KeywordSearch.scraping_completed_at: completed_at,
+                    KeywordSearch.scraping_error: error,
+                    KeywordSearch.updated_at: datetime.utcnow(),
+                },
+                synchronize_session=False
+            )
+            session.commit()
+            return updated > 0
+        finally:
+            session.close()
+    
     def get_keyword_search(self, search_id: str) -> Optional[KeywordSearch]:
         """Get a keyword search by ID."""
         session = self.get_session()
@@ -157,6 +228,54 @@ class LeadStorage:
         finally:
             session.close()
     
+    def get_last_scrape_times(self, search_ids: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        Get last scrape times for several keyword searches in one query.
+        
+        Args:
+            search_ids: Keyword search IDs
+            
+        Returns:
+            Dictionary of search ID to last_scrape_at (missing IDs are omitted)
+        """
+        if not search_ids:
+            return {}
+        
+        session = self.get_session()
+        try:
+            rows = session.query(KeywordSearch.id, KeywordSearch.last_scrape_at).filter(
+                KeywordSearch.id.in_(search_ids)
+            ).all()
+            return {search_id: last_scrape_at for search_id, last_scrape_at in rows}
+        finally:
+            session.close()
+    
+    def get_search_counts(self) -> Dict[str, int]:
+        """
+        Count keyword searches in a single aggregate query.
+        
+        Returns:
+            Dictionary with total, enabled and scheduled_enabled counts
+        """
+        session = self.get_session()
+        try:
+            total, enabled, scheduled_enabled = session.query(
+                func.count(KeywordSearch.id),
+                func.sum(case((KeywordSearch.enabled == True, 1), else_=0)),
+                func.sum(case(
+                    (and_(KeywordSearch.enabled == True, KeywordSearch.scraping_mode == "scheduled"), 1),
+                    else_=0
+                ))
+            ).one()
+            
+            return {
+                "total": total,
+                "enabled": enabled or 0,
+                "scheduled_enabled": scheduled_enabled or 0
+            }
+        finally:
+            session.close()
+    
     def get_due_keyword_searches(self) -> List[KeywordSearch]:
         """
         Get keyword searches that are due for scraping.
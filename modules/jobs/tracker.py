@@ -5,7 +5,7 @@ Prevents concurrent scrapes and enforces cooldown periods.
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from core.config import get_config
 from core.logger import get_logger
@@ -87,15 +87,51 @@ class JobTracker:
         cooldown = min_cooldown_minutes or self.cooldown_minutes
         search = self.storage.get_keyword_search(search_id)
         
-        if search and search.last_scrape_at:
-            time_since_last = datetime.utcnow() - search.last_scrape_at
+        reason = self._cooldown_reason(search.last_scrape_at if search else None, cooldown)
+        return reason is None, reason
+    
+    def get_blocked_ids(
+        self,
+        candidate_ids: List[str],
+        min_cooldown_minutes: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Check several searches at once (one database query for all cooldowns).
+        
+        Args:
+            candidate_ids: Keyword search IDs
+            min_cooldown_minutes: Minimum cooldown in minutes (uses default if None)
+            
+        Returns:
+            Dictionary of search ID to reason for searches that cannot start
+        """
+        cooldown = min_cooldown_minutes or self.cooldown_minutes
+        last_scrape_times = self.storage.get_last_scrape_times(candidate_ids)
+        blocked = {}
+        
+        for search_id in candidate_ids:
+            if self.is_job_running(search_id):
+                blocked[search_id] = f"Job already running for search {search_id}"
+                continue
+            
+            reason = self._cooldown_reason(last_scrape_times.get(search_id), cooldown)
+            if reason:
+                blocked[search_id] = reason
+        
+        return blocked
+    
+    @staticmethod
+    def _cooldown_reason(last_scrape_at: Optional[datetime], cooldown: int) -> Optional[str]:
+        """Get the reason a search is still cooling down, or None if it may run."""
+        if last_scrape_at:
+            time_since_last = datetime.utcnow() - last_scrape_at
             minutes_since = time_since_last.total_seconds() / 60
             
             if minutes_since < cooldown:
                 remaining = cooldown - minutes_since
-                return False, f"Cooldown period not met. Wait {remaining:.1f} more minutes"
+                return f"Cooldown period not met. Wait {remaining:.1f} more minutes"
         
-        return True, None
+        return None
     
     def start_job(self, search_id: str) -> bool:
         """
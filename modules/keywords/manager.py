@@ -5,11 +5,11 @@ Simplified - works with database storage.
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from core.logger import get_logger
 from core.state import KeywordSearchState
-from modules.database.storage import LeadStorage
+from modules.database.storage import LeadStorage, StaleStateError
 
 logger = get_logger(__name__)
 
@@ -118,30 +118,28 @@ class KeywordSearchManager:
         **updates
     ) -> Optional[KeywordSearchState]:
         """Update a keyword search."""
-        search = self.get_search(search_id)
+        def apply(search: KeywordSearchState) -> None:
+            # Update fields
+            for key, value in updates.items():
+                if hasattr(search, key):
+                    setattr(search, key, value)
+            
+            # Recalculate next_scrape_at if interval changed
+            if "scraping_interval" in updates and search.scraping_mode == "scheduled":
+                if search.scraping_interval:
+                    search.next_scrape_at = self._calculate_next_scrape(
+                        datetime.utcnow(),
+                        search.scraping_interval
+                    )
+                else:
+                    search.next_scrape_at = None
+            
+            search.updated_at = datetime.utcnow()
+        
+        search = self._update_with_retry(search_id, apply)
         if not search:
             return None
         
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(search, key):
-                setattr(search, key, value)
-        
-        # Recalculate next_scrape_at if interval changed
-        if "scraping_interval" in updates and search.scraping_mode == "scheduled":
-            if search.scraping_interval:
-                search.next_scrape_at = self._calculate_next_scrape(
-                    datetime.utcnow(),
-                    search.scraping_interval
-                )
-            else:
-                search.next_scrape_at = None
-        
-        search.updated_at = datetime.utcnow()
-        
-        # Save to database
-        self.storage.save_keyword_search(search)
-        
         logger.info("Updated keyword search", search_id=search_id, updates=updates)
         
         return search
@@ -152,27 +150,56 @@ class KeywordSearchManager:
     
     def mark_scraped(self, search_id: str) -> None:
         """Mark a search as scraped and update next scrape time."""
-        search = self.get_search(search_id)
+        def apply(search: KeywordSearchState) -> None:
+            now = datetime.utcnow()
+            search.last_scrape_at = now
+            
+            if search.scraping_mode == "scheduled" and search.scraping_interval:
+                search.next_scrape_at = self._calculate_next_scrape(now, search.scraping_interval)
+            
+            search.updated_at = now
+        
+        search = self._update_with_retry(search_id, apply)
         if not search:
             return
         
-        now = datetime.utcnow()
-        search.last_scrape_at = now
-        
-        if search.scraping_mode == "scheduled" and search.scraping_interval:
-            search.next_scrape_at = self._calculate_next_scrape(now, search.scraping_interval)
-        
-        search.updated_at = now
-        
-        # Save to database
-        self.storage.save_keyword_search(search)
-        
         logger.info(
             "Marked search as scraped",
             search_id=search_id,
             next_scrape=search.next_scrape_at
         )
     
+    def _update_with_retry(
+        self,
+        search_id: str,
+        apply: Callable[[KeywordSearchState], None]
+    ) -> Optional[KeywordSearchState]:
+        """
+        Read a search, apply changes and save it, re-reading once on a concurrent write.
+        
+        Args:
+            search_id: Keyword search ID
+            apply: Function applying the changes to the read state
+            
+        Returns:
+            Saved keyword search state, or None if not found
+        """
+        for attempt in range(2):
+            search = self.get_search(search_id)
+            if not search:
+                return None
+            
+            apply(search)
+            
+            try:
+                # Save to database
+                self.storage.save_keyword_search(search)
+                return search
+            except StaleStateError:
+                if attempt:
+                    raise
+                logger.info("Keyword search modified concurrently, retrying update", search_id=search_id)
+    
     def get_due_searches(self) -> List[KeywordSearchState]:
         """Get searches that are due for scraping."""
         search_models = self.storage.get_due_keyword_searches()
@@ -216,6 +243,7 @@ class KeywordSearchManager:
             scraping_started_at=getattr(model, "scraping_started_at", None),
             scraping_completed_at=getattr(model, "scraping_completed_at", None),
             scraping_error=getattr(model, "scraping_error", None),
-            webhook_url=getattr(model, "webhook_url", None)
+            webhook_url=getattr(model, "webhook_url", None),
+            version=getattr(model, "version", 0)
         )
 
@@ -3,7 +3,7 @@ Keyword matching for filtering content.
 """
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from core.logger import get_logger
 
@@ -27,6 +27,9 @@ class KeywordMatcher:
         # Prepare keywords for matching with word boundaries
         self.prepared_keywords = self._prepare_keywords(self.keywords)
         
+        # Single alternation of all keywords, used to reject non-matching text in one scan
+        self.combined_pattern = self._prepare_combined(self.keywords)
+        
         logger.debug("Initialized KeywordMatcher", keyword_count=len(self.keywords))
     
     def _prepare_keywords(self, keywords: List[str]) -> List[Tuple[str, re.Pattern]]:
@@ -43,6 +46,15 @@ class KeywordMatcher:
         
         return prepared
     
+    def _prepare_combined(self, keywords: List[str]) -> Optional[re.Pattern]:
+        """Prepare one pattern that matches if any keyword matches."""
+        if not keywords:
+            return None
+        
+        alternation = "|".join(rf"\b{re.escape(keyword)}\b" for keyword in keywords)
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        return re.compile(f"(?:{alternation})", flags)
+    
     def match(self, text: str) -> Tuple[bool, List[str]]:
         """
         Check if text contains any keywords.
@@ -56,6 +68,10 @@ class KeywordMatcher:
         if not text or not self.keywords:
             return False, []
         
+        # Most texts match nothing: reject them with a single scan
+        if not self.combined_pattern.search(text):
+            return False, []
+        
         matched = []
         for keyword, pattern in self.prepared_keywords:
             if pattern.search(text):
@@ -77,7 +93,19 @@ class KeywordMatcher:
             return 0.0
         
         _, matched = self.match(text)
-        if not matched:
+        return self.score_matches(matched)
+    
+    def score_matches(self, matched: List[str]) -> float:
+        """
+        Get match score for keywords already returned by match().
+        
+        Args:
+            matched: Matched keywords
+            
+        Returns:
+            Match score (0.0 to 1.0)
+        """
+        if not matched or not self.keywords:
             return 0.0
         
         # Score based on percentage of keywords matched
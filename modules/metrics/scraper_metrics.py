@@ -5,6 +5,7 @@ Tracks success rates, error rates, and performance metrics.
 
 from collections import defaultdict
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
@@ -40,6 +41,9 @@ class ScrapingMetrics:
     # Retry stats
     retry_count: int = 0
     
+    # Serialized form, frozen once the metrics are recorded
+    _dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
     def success_rate(self) -> float:
         """Calculate success rate (0.0 to 1.0)."""
         total = self.posts_scraped + self.posts_failed + self.comments_scraped + self.comments_failed
@@ -49,7 +53,11 @@ class ScrapingMetrics:
         return successful / total
     
     def to_dict(self) -> Dict:
-        """Convert to dictionary."""
+        """Convert to dictionary (cached once metrics are recorded)."""
+        if self._dict is not None:
+            # Shallow copy (all values are immutable) so callers can't alter the cache
+            return dict(self._dict)
+        
         return {
             "search_id": self.search_id,
             "platform": self.platform,
@@ -91,35 +99,53 @@ class ScrapingMetricsCollector:
         Args:
             metrics: Scraping metrics to record
         """
-        # Set end time if not set
-        if not metrics.end_time:
-            metrics.end_time = datetime.utcnow()
+        self.record_metrics_bulk([metrics])
+    
+    def record_metrics_bulk(self, metrics_list: List[ScrapingMetrics]):
+        """
+        Record several scraping metrics at once (e.g. one per subreddit).
+        Old metrics are pruned once for the whole batch.
         
-        # Calculate duration
-        if metrics.start_time and metrics.end_time:
-            metrics.duration_seconds = (metrics.end_time - metrics.start_time).total_seconds()
+        Args:
+            metrics_list: Scraping metrics to record
+        """
+        if not metrics_list:
+            return
         
-        # Store metrics
-        self._recent_metrics.append(metrics)
-        self._metrics_by_search[metrics.search_id].append(metrics)
-        self._metrics_by_platform[metrics.platform].append(metrics)
+        now = datetime.utcnow()
+        
+        for metrics in metrics_list:
+            # Set end time if not set
+            if not metrics.end_time:
+                metrics.end_time = now
+            
+            # Calculate duration
+            if metrics.start_time and metrics.end_time:
+                metrics.duration_seconds = (metrics.end_time - metrics.start_time).total_seconds()
+            
+            # Metrics are immutable after recording, so serialize once
+            metrics._dict = metrics.to_dict()
+            
+            # Store metrics
+            self._metrics_by_search[metrics.search_id].append(metrics)
+            self._metrics_by_platform[metrics.platform].append(metrics)
+            
+            logger.info(
+                "Recorded scraping metrics",
+                search_id=metrics.search_id,
+                platform=metrics.platform,
+                posts_scraped=metrics.posts_scraped,
+                comments_scraped=metrics.comments_scraped,
+                success_rate=metrics.success_rate(),
+                duration_seconds=metrics.duration_seconds
+            )
         
         # Clean up old metrics (older than 24 hours)
-        cutoff = datetime.utcnow() - timedelta(hours=24)
+        cutoff = now - timedelta(hours=24)
         self._recent_metrics = [
-            m for m in self._recent_metrics
+            m for m in chain(self._recent_metrics, metrics_list)
             if m.start_time and m.start_time >= cutoff
         ]
-        
-        logger.info(
-            "Recorded scraping metrics",
-            search_id=metrics.search_id,
-            platform=metrics.platform,
-            posts_scraped=metrics.posts_scraped,
-            comments_scraped=metrics.comments_scraped,
-            success_rate=metrics.success_rate(),
-            duration_seconds=metrics.duration_seconds
-        )
     
     def get_search_metrics(self, search_id: str) -> List[ScrapingMetrics]:
         """Get all metrics for a search."""
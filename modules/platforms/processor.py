@@ -5,6 +5,8 @@ Future-proof for LinkedIn/Twitter.
 
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 from core.logger import get_logger
 from modules.platforms.base import BasePlatformScraper
 from modules.reddit.scraper import RedditScraper
@@ -81,6 +83,35 @@ class PlatformProcessor:
         
         return posts, comments
     
+    async def process_platform_bytes(
+        self,
+        platform: str,
+        config: Dict[str, Any],
+        include_comments: bool = True,
+        search_id: Optional[str] = None
+    ) -> bytes:
+        """
+        Process a platform and return the results serialized as JSON.
+        
+        Args:
+            platform: Platform name
+            config: Platform-specific configuration
+            include_comments: Whether to scrape comments
+            search_id: Optional search ID for metrics tracking
+            
+        Returns:
+            UTF-8 JSON bytes of {"posts": [...], "comments": [...]}
+        """
+        posts, comments = await self.process_platform(
+            platform=platform,
+            config=config,
+            include_comments=include_comments,
+            search_id=search_id
+        )
+        
+        # orjson serializes datetimes natively and emits bytes directly
+        return orjson.dumps({"posts": posts, "comments": comments})
+    
     async def close_all(self):
         """Close all scraper connections."""
         for platform, scraper in self._scrapers.items():
@@ -0,0 +1,201 @@
+"""
+Shared client for Reddit's OAuth JSON API.
+One keep-alive connection pool and one application-only token are shared by
+all scraper instances, so later searches skip the TCP/TLS handshake and the
+token request.
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+import orjson
+
+from core.config import get_config
+from core.logger import get_logger
+from modules.reddit.rate_limiter import get_global_rate_limiter
+
+logger = get_logger(__name__)
+
+REDDIT_TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+REDDIT_OAUTH_URL = "https://oauth.reddit.com"
+
+# Seconds to back off after a 429 that carries no reset/Retry-After header
+DEFAULT_RATE_LIMIT_PAUSE = 60.0
+
+
+def _header_float(response: httpx.Response, name: str) -> Optional[float]:
+    """Read a numeric response header, or None if missing or malformed."""
+    value = response.headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RedditAPIClient:
+    """Shared HTTP client and token for Reddit's OAuth API."""
+    
+    def __init__(self):
+        """Initialize Reddit API client."""
+        self.config = get_config()
+        
+        # httpx connections are bound to the event loop that opened them, so
+        # keep one pool per running loop (dropped when the loop is collected)
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # One token refresh at a time per loop, so a fan-out of requests that all
+        # find the token expired sends a single token request
+        self._token_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._access_token: Optional[str] = None
+        self._access_token_expires_at = 0.0
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get or create the keep-alive HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        
+        if client is None or client.is_closed:
+            if not self.config.reddit_client_id or not self.config.reddit_client_secret:
+                raise ValueError("Reddit API credentials not configured")
+            
+            client = self._clients[loop] = httpx.AsyncClient(
+                base_url=REDDIT_OAUTH_URL,
+                headers={"User-Agent": self.config.reddit_user_agent},
+                timeout=self.config.reddit_connection_timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            
+            logger.info(
+                "Initialized Reddit API HTTP client",
+                user_agent=self.config.reddit_user_agent,
+                timeout=self.config.reddit_connection_timeout
+            )
+        
+        return client
+    
+    def _token_is_valid(self) -> bool:
+        """Whether the cached token can still be used."""
+        return self._access_token is not None and time.monotonic() < self._access_token_expires_at
+    
+    async def _get_access_token(self) -> str:
+        """Get an application-only OAuth token, fetching a new one when expired."""
+        if self._token_is_valid():
+            return self._access_token
+        
+        loop = asyncio.get_running_loop()
+        lock = self._token_locks.get(loop)
+        if lock is None:
+            lock = self._token_locks[loop] = asyncio.Lock()
+        
+        async with lock:
+            # Another request may have refreshed the token while we waited
+            if self._token_is_valid():
+                return self._access_token
+            
+            response = await self.http.post(
+                REDDIT_TOKEN_URL,
+                auth=(self.config.reddit_client_id, self.config.reddit_client_secret),
+                data={"grant_type": "client_credentials"}
+            )
+            response.raise_for_status()
+            payload = orjson.loads(response.content)
+            
+            self._access_token = payload["access_token"]
+            # Refresh a minute early so in-flight requests never carry an expired token
+            self._access_token_expires_at = time.monotonic() + payload.get("expires_in", 3600) - 60
+            
+            return self._access_token
+    
+    async def get(self, path: str, params: Dict[str, Any]) -> Any:
+        """
+        GET a Reddit OAuth API endpoint.
+        
+        Args:
+            path: API path (e.g. "/r/python/new")
+            params: Query parameters
+            
+        Returns:
+            Decoded JSON response
+        """
+        token = await self._get_access_token()
+        response = await self.http.get(
+            path,
+            params=params,
+            headers={"Authorization": f"bearer {token}"}
+        )
+        
+        # Honour Reddit's own quota, which also counts requests from other clients
+        # sharing the credentials
+        rate_limiter = get_global_rate_limiter()
+        reset_seconds = _header_float(response, "X-Ratelimit-Reset")
+        rate_limiter.update_from_headers(
+            _header_float(response, "X-Ratelimit-Remaining"),
+            reset_seconds
+        )
+        if response.status_code == 429:
+            # Retries wait in the rate limiter until Reddit's window resets
+            rate_limiter.pause(
+                reset_seconds
+                or _header_float(response, "Retry-After")
+                or DEFAULT_RATE_LIMIT_PAUSE
+            )
+        
+        if response.status_code == 401 and self._access_token == token:
+            # Token revoked or expired early; drop it so the retry fetches a new one
+            # (only if no other request has replaced it already)
+            self._access_token = None
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def warmup(self) -> None:
+        """
+        Open a connection and fetch a token ahead of the first scrape.
+        
+        Failures are logged and otherwise ignored; the first scrape will
+        simply pay the connection cost instead.
+        """
+        try:
+            await self.get("/r/announcements/about", {"raw_json": 1})
+            logger.info("Warmed up Reddit API connection")
+        except Exception as e:
+            logger.warning(
+                "Reddit API warmup failed",
+                error=str(e),
+                error_type=type(e).__name__
+            )
+    
+    async def close(self) -> None:
+        """Close the running loop's HTTP client (e.g. on application shutdown)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        
+        client = self._clients.pop(loop, None)
+        if client is not None:
+            try:
+                await client.aclose()
+                logger.info("Closed Reddit API HTTP client")
+            except Exception as e:
+                logger.warning("Error closing Reddit API HTTP client", error=str(e))
+
+
+# Global client instance
+_api_client: Optional[RedditAPIClient] = None
+
+
+def get_reddit_api_client() -> RedditAPIClient:
+    """Get or create global Reddit API client instance."""
+    global _api_client
+    if _api_client is None:
+        _api_client = RedditAPIClient()
+    return _api_client
@@ -0,0 +1,204 @@
+"""
+Short-lived cache for scraped Reddit listings and comment trees.
+Shared by all scraper instances so searches that revisit the same subreddit
+within the TTL skip the Reddit API (and the global rate limiter) entirely.
+With the "redis" backend, entries are also shared across processes.
+"""
+
+import asyncio
+import math
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import quote
+
+import orjson
+
+from core.config import get_config
+from core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RedditResponseCache:
+    """TTL cache of scraped post/comment dictionaries (in-process, optionally backed by Redis)."""
+    
+    def __init__(self, ttl: float, max_entries: int = 512, redis_url: Optional[str] = None):
+        """
+        Initialize response cache.
+        
+        Args:
+            ttl: Seconds an entry stays valid (0 disables caching)
+            max_entries: Maximum number of in-process entries; oldest are evicted first
+            redis_url: Optional Redis URL to share entries across processes
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        
+        # Key -> (expiry time (monotonic), items), in insertion order
+        self._entries: Dict[Hashable, Tuple[float, List[Dict[str, Any]]]] = {}
+        
+        # redis.asyncio connections are bound to the event loop that opened them
+        self._redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        logger.info(
+            "Initialized RedditResponseCache",
+            ttl=ttl,
+            max_entries=max_entries,
+            backend="redis" if redis_url else "memory"
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return self.ttl > 0
+    
+    def _get_redis(self) -> Optional[Any]:
+        """Get the Redis client for the running event loop, if a Redis backend is configured."""
+        if not self.redis_url:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        client = self._redis_clients.get(loop)
+        if client is None:
+            # Lazy import redis (optional dependency)
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError:
+                logger.warning(
+                    "Redis module not installed, caching Reddit responses in memory only. "
+                    "Install redis package for Redis support."
+                )
+                self.redis_url = None
+                return None
+            
+            client = self._redis_clients[loop] = redis_asyncio.Redis.from_url(
+                self.redis_url,
+                socket_connect_timeout=2,
+                decode_responses=False
+            )
+        
+        return client
+    
+    @staticmethod
+    def _redis_key(key: Hashable) -> str:
+        """Build the Redis key for a cache key (e.g. reddit:listing:python:new:day:100)."""
+        parts = key if isinstance(key, tuple) else (key,)
+        return "reddit:" + ":".join(str(part) for part in parts)
+    
+    async def get(self, key: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached items for a key.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Copies of the cached items, or None if missing or expired
+        """
+        if not self.enabled:
+            return None
+        
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, items = entry
+            if expires_at > time.monotonic():
+                return [dict(item) for item in items]
+            del self._entries[key]
+        
+        redis_client = self._get_redis()
+        if redis_client is None:
+            return None
+        
+        try:
+            raw = await redis_client.get(self._redis_key(key))
+        except Exception as e:
+            logger.warning("Redis cache read failed", error=str(e))
+            return None
+        
+        if raw is None:
+            return None
+        
+        items = orjson.loads(raw)
+        for item in items:
+            # JSON has no datetime; rebuild it from the numeric timestamp
+            if "created_utc_ts" in item:
+                item["created_utc"] = datetime.fromtimestamp(item["created_utc_ts"])
+        
+        self._store(key, items)
+        return [dict(item) for item in items]
+    
+    async def set(self, key: Hashable, items: List[Dict[str, Any]]) -> None:
+        """
+        Cache items for a key.
+        
+        Args:
+            key: Cache key
+            items: Scraped post/comment dictionaries (copied)
+        """
+        if not self.enabled:
+            return
+        
+        self._store(key, [dict(item) for item in items])
+        
+        redis_client = self._get_redis()
+        if redis_client is None:
+            return
+        
+        try:
+            await redis_client.set(
+                self._redis_key(key),
+                orjson.dumps(items),
+                ex=max(1, math.ceil(self.ttl))
+            )
+        except Exception as e:
+            logger.warning("Redis cache write failed", error=str(e))
+    
+    def _store(self, key: Hashable, items: List[Dict[str, Any]]) -> None:
+        """Store items in the in-process cache, evicting stale/oldest entries."""
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + self.ttl, items)
+        
+        # Evict expired entries, then the oldest ones if still over capacity
+        if len(self._entries) > self.max_entries:
+            for stale_key in [k for k, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[stale_key]
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+    
+    def clear(self) -> None:
+        """Drop all in-process entries."""
+        self._entries.clear()
+
+
+def _get_redis_url() -> Optional[str]:
+    """Build the Redis URL for the response cache, or None for the memory backend."""
+    config = get_config()
+    if config.reddit_cache_backend != "redis" or not config.redis_host:
+        return None
+    
+    if config.redis_password:
+        # Percent-encode so passwords containing @, :, / or # keep the URL valid
+        password = quote(config.redis_password, safe="")
+        return f"redis://:{password}@{config.redis_host}:{config.redis_port}/{config.redis_db}"
+    return f"redis://{config.redis_host}:{config.redis_port}/{config.redis_db}"
+
+
+# Global cache instance
+_response_cache: Optional[RedditResponseCache] = None
+
+
+def get_response_cache() -> RedditResponseCache:
+    """Get or create global Reddit response cache instance."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = RedditResponseCache(
+            ttl=get_config().reddit_cache_ttl,
+            redis_url=_get_redis_url()
+        )
+    return _response_cache
@@ -2,8 +2,10 @@
 Filters for Reddit posts and comments.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.logger import get_logger
 from modules.keywords.matching import KeywordMatcher
@@ -19,6 +21,63 @@ class RedditFilter:
         """Initialize Reddit filter."""
         logger.info("Initialized RedditFilter")
     
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+        """Get a compiled keyword matcher, cached per keyword tuple."""
+        return KeywordMatcher(list(keywords))
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _get_detector(patterns: Tuple[str, ...]) -> PatternDetector:
+        """Get a compiled pattern detector, cached per custom pattern tuple."""
+        return PatternDetector(custom_patterns=list(patterns))
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the compiled matcher and detector caches."""
+        RedditFilter._get_matcher.cache_clear()
+        RedditFilter._get_detector.cache_clear()
+    
+    @staticmethod
+    def _match_text(
+        text: str,
+        matcher: Optional[KeywordMatcher],
+        detector: Optional[PatternDetector]
+    ) -> Tuple:
+        """
+        Run keyword matching and pattern detection on a single text.
+        
+        Without a matcher every text counts as a keyword match, mirroring
+        filter_by_keywords with no keywords.
+        
+        Returns:
+            Tuple of (has_keyword, matched_keywords, match_score,
+            has_pattern, detected_pattern, has_urgency)
+        """
+        has_keyword, matched, score = True, [], 0.0
+        if matcher:
+            has_keyword, matched = matcher.match(text)
+            score = matcher.score_matches(matched)
+        
+        has_pattern, matched_pattern, has_urgency = False, None, False
+        if detector:
+            has_pattern, matched_pattern = detector.detect(text)
+            if has_pattern:
+                has_urgency = detector.has_urgency(text)
+        
+        return has_keyword, matched, score, has_pattern, matched_pattern, has_urgency
+    
+    @staticmethod
+    def _get_texts(items: List[Dict[str, Any]]) -> List[str]:
+        """Get the searchable text content of posts/comments, parallel to items."""
+        return [
+            f"{item.get('title', '')} {item.get('content', '')}"
+            if item.get('source_type') == 'post'
+            else item.get('content', '')
+            for item in items
+        ]
+    
     def filter_by_keywords(
         self,
         items: List[Dict[str, Any]],
@@ -28,21 +87,18 @@ class RedditFilter:
         if not keywords:
             return items
         
-        matcher = KeywordMatcher(keywords)
+        matcher = self._get_matcher(tuple(keywords))
         filtered = []
+        text_cache: Dict[str, Tuple[bool, List[str]]] = {}
         
-        for item in items:
-            # Get text content
-            if item.get('source_type') == 'post':
-                text = f"{item.get('title', '')} {item.get('content', '')}"
-            else:
-                text = item.get('content', '')
-            
-            # Check for match
-            has_match, matched = matcher.match(text)
+        for item, text in zip(items, self._get_texts(items)):
+            # Check for match (identical texts are matched once)
+            if text not in text_cache:
+                text_cache[text] = matcher.match(text)
+            has_match, matched = text_cache[text]
             if has_match:
-                item['matched_keywords'] = matched
-                item['match_score'] = matcher.get_match_score(text)
+                item['matched_keywords'] = list(matched)
+                item['match_score'] = matcher.score_matches(matched)
                 filtered.append(item)
         
         logger.info(
@@ -59,16 +115,10 @@ class RedditFilter:
         patterns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """Filter items by pattern detection."""
-        detector = PatternDetector(custom_patterns=patterns)
+        detector = self._get_detector(tuple(patterns or ()))
         filtered = []
         
-        for item in items:
-            # Get text content
-            if item.get('source_type') == 'post':
-                text = f"{item.get('title', '')} {item.get('content', '')}"
-            else:
-                text = item.get('content', '')
-            
+        for item, text in zip(items, self._get_texts(items)):
             # Check for pattern
             has_pattern, matched_pattern = detector.detect(text)
             if has_pattern:
@@ -105,28 +155,53 @@ class RedditFilter:
         Returns:
             Filtered list
         """
-        # Apply time and score filters first
-        filtered = items
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        # Apply time and score filters first (single pass over items),
+        # comparing the numeric (epoch) timestamps set by the scraper
+        cutoff_ts = time.time() - hours * 3600
         filtered = [
-            item for item in filtered
-            if item.get('created_utc', datetime.min) >= cutoff
+            item for item in items
+            if item.get('created_utc_ts', 0.0) >= cutoff_ts
+            and item.get('score', 0) >= min_score
         ]
         
-        filtered = [
-            item for item in filtered
-            if item.get('score', 0) >= min_score
-        ]
+        # Apply keyword OR pattern matching (not AND) in a single pass,
+        # building each item's text once for both matchers
+        matcher = self._get_matcher(tuple(keywords)) if keywords else None
+        detector = self._get_detector(tuple(patterns)) if patterns else None
+        keyword_matches = []
+        pattern_matches = []
+        pattern_only_matches = []
+        text_cache: Dict[str, Tuple] = {}
         
-        # Apply keyword OR pattern matching (not AND)
-        keyword_matches = self.filter_by_keywords(filtered, keywords=keywords)
-        pattern_matches = self.filter_by_patterns(filtered, patterns=patterns) if patterns else []
+        for item, text in zip(filtered, self._get_texts(filtered)):
+            # Identical texts (e.g. repeated short comments) are matched once
+            result = text_cache.get(text)
+            if result is None:
+                result = text_cache[text] = self._match_text(text, matcher, detector)
+            has_keyword, matched, score, has_pattern, matched_pattern, has_urgency = result
+            
+            if matcher and has_keyword:
+                item['matched_keywords'] = list(matched)
+                item['match_score'] = score
+            
+            if has_pattern:
+                item['detected_pattern'] = matched_pattern
+                item['has_urgency'] = has_urgency
+                pattern_matches.append(item)
+            
+            if has_keyword:
+                keyword_matches.append(item)
+            elif has_pattern:
+                pattern_only_matches.append(item)
         
-        # Combine using OR logic (union of both sets)
+        # Combine using OR logic (union of both sets). Each item lands in only
+        # one of the two lists, so the union just appends pattern-only matches
+        # and drops items with missing or repeated ids.
         combined_ids = set()
         final_filtered = []
+        candidates = chain(keyword_matches, pattern_only_matches) if pattern_only_matches else keyword_matches
         
-        for item in keyword_matches + pattern_matches:
+        for item in candidates:
             item_id = item.get('id')
             if item_id and item_id not in combined_ids:
                 combined_ids.add(item_id)
@@ -4,7 +4,6 @@ Reddit post and comment parser.
 
 import re
 from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
 
 from core.logger import get_logger
 
@@ -16,19 +15,43 @@ class RedditParser:
     
     # Email regex pattern
     EMAIL_PATTERN = re.compile(
-        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
     )
     
-    # URL regex pattern
+    # URL regex pattern (scheme literal, then everything up to whitespace/quotes/brackets)
     URL_PATTERN = re.compile(
-        r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+        r'https?://[^\s<>"\']+'
     )
     
+    # Host (netloc) of each URL matched by URL_PATTERN
+    HOST_FROM_URL_PATTERN = re.compile(
+        r'https?://([^/?#\s<>"\']+)'
+    )
+    
+    # Domains (and their subdomains) that are never treated as leads' sites
+    BLOCKED_DOMAINS = ('reddit.com', 'imgur.com', 'youtube.com')
+    # Subdomain suffixes (".reddit.com"), so unrelated hosts such as
+    # notreddit.com are not blocked
+    BLOCKED_SUBDOMAIN_SUFFIXES = tuple('.' + domain for domain in BLOCKED_DOMAINS)
+    
     # Domain pattern (without http/https)
     DOMAIN_PATTERN = re.compile(
         r'\b(?:[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}\b'
     )
     
+    # Company name patterns
+    COMPANY_PATTERNS = [
+        re.compile(r'\bat\s+([A-Z][A-Za-z0-9\s&]+(?:Inc|LLC|Ltd|Corp)?)'),
+        re.compile(r'\bfor\s+([A-Z][A-Za-z0-9\s&]+(?:Inc|LLC|Ltd|Corp)?)'),
+        re.compile(r'\bcompany:\s*([A-Z][A-Za-z0-9\s&]+)'),
+    ]
+    
+    # Contact keywords (case-insensitive substring match)
+    CONTACT_PATTERN = re.compile(
+        r'email|contact|reach out|dm me|message me',
+        re.IGNORECASE
+    )
+    
     def parse_post(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse a Reddit post and extract information.
@@ -42,12 +65,7 @@ class RedditParser:
         text = f"{post_data.get('title', '')} {post_data.get('content', '')}"
         
         parsed = post_data.copy()
-        parsed.update({
-            "emails": self.extract_emails(text),
-            "urls": self.extract_urls(text),
-            "domains": self.extract_domains(text),
-            "has_contact_info": self._has_contact_info(text),
-        })
+        parsed.update(self._scan(text))
         
         return parsed
     
@@ -64,22 +82,104 @@ class RedditParser:
         text = comment_data.get('content', '')
         
         parsed = comment_data.copy()
-        parsed.update({
-            "emails": self.extract_emails(text),
-            "urls": self.extract_urls(text),
-            "domains": self.extract_domains(text),
-            "has_contact_info": self._has_contact_info(text),
-        })
+        parsed.update(self._scan(text))
         
         return parsed
     
+    def parse_posts(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of Reddit posts.
+        
+        Args:
+            posts: Raw post data from scraper
+            
+        Returns:
+            Parsed posts, in input order
+        """
+        texts = [f"{post.get('title', '')} {post.get('content', '')}" for post in posts]
+        return self._parse_batch(posts, texts)
+    
+    def parse_comments(self, comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of Reddit comments.
+        
+        Args:
+            comments: Raw comment data from scraper
+            
+        Returns:
+            Parsed comments, in input order
+        """
+        texts = [comment.get('content', '') for comment in comments]
+        return self._parse_batch(comments, texts)
+    
+    def _parse_batch(
+        self,
+        items: List[Dict[str, Any]],
+        texts: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse items whose texts have already been built.
+        
+        Identical texts (e.g. repeated short comments) are scanned once; each
+        item still gets its own copies of the extracted lists.
+        
+        Args:
+            items: Raw post/comment data from scraper
+            texts: Text of each item, parallel to items
+            
+        Returns:
+            Parsed items, in input order
+        """
+        scans: Dict[str, Dict[str, Any]] = {}
+        parsed_items = []
+        
+        for item, text in zip(items, texts):
+            scan = scans.get(text)
+            if scan is None:
+                scan = scans[text] = self._scan(text)
+            
+            parsed = item.copy()
+            parsed.update(
+                emails=list(scan["emails"]),
+                urls=list(scan["urls"]),
+                domains=list(scan["domains"]),
+                has_contact_info=scan["has_contact_info"],
+            )
+            parsed_items.append(parsed)
+        
+        return parsed_items
+    
+    def _scan(self, text: str) -> Dict[str, Any]:
+        """
+        Run every extractor over text once.
+        
+        Emails and domains feed the contact check, so each regex is applied a
+        single time per item.
+        
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Dictionary with emails, urls, domains and has_contact_info
+        """
+        emails = self.extract_emails(text)
+        urls = self.extract_urls(text)
+        domains = self.extract_domains(text)
+        
+        return {
+            "emails": emails,
+            "urls": urls,
+            "domains": domains,
+            "has_contact_info": self._has_contact_info(text, emails=emails, domains=domains),
+        }
+    
     def extract_emails(self, text: str) -> List[str]:
         """Extract email addresses from text."""
         if not text:
             return []
         
         emails = self.EMAIL_PATTERN.findall(text)
-        return list(set(emails))  # Remove duplicates
+        return list(dict.fromkeys(emails))  # Remove duplicates, keep order
     
     def extract_urls(self, text: str) -> List[str]:
         """Extract URLs from text."""
@@ -87,47 +187,33 @@ class RedditParser:
             return []
         
         urls = self.URL_PATTERN.findall(text)
-        return list(set(urls))
+        return list(dict.fromkeys(urls))
     
     def extract_domains(self, text: str) -> List[str]:
         """Extract domain names from text."""
         if not text:
             return []
         
-        domains = set()
-        
-        # Extract from URLs
-        urls = self.extract_urls(text)
-        for url in urls:
-            try:
-                parsed = urlparse(url)
-                if parsed.netloc:
-                    domains.add(parsed.netloc)
-            except Exception:
-                pass
+        # Insertion-ordered set, seeded with the hosts of URLs in the text
+        domains: Dict[str, None] = dict.fromkeys(self.HOST_FROM_URL_PATTERN.findall(text))
         
         # Extract standalone domains
         standalone = self.DOMAIN_PATTERN.findall(text)
-        domains.update(standalone)
-        
-        # Filter out common non-domain matches
-        filtered = [
-            d for d in domains
-            if not any(x in d.lower() for x in ['reddit.com', 'imgur.com', 'youtube.com'])
-        ]
+        domains.update(dict.fromkeys(standalone))
         
-        return list(filtered)
+        # Filter out common non-domain matches (host compared without
+        # userinfo or port, so "reddit.com:443" is still recognised)
+        return [d for d in domains if not self._is_blocked_host(d)]
+    
+    def _is_blocked_host(self, domain: str) -> bool:
+        """Whether a domain is, or is a subdomain of, one of BLOCKED_DOMAINS."""
+        host = domain.lower().rpartition('@')[2].partition(':')[0]
+        return host in self.BLOCKED_DOMAINS or host.endswith(self.BLOCKED_SUBDOMAIN_SUFFIXES)
     
     def extract_company_name(self, text: str) -> Optional[str]:
         """Attempt to extract company name from text."""
-        patterns = [
-            r'\bat\s+([A-Z][A-Za-z0-9\s&]+(?:Inc|LLC|Ltd|Corp)?)',
-            r'\bfor\s+([A-Z][A-Za-z0-9\s&]+(?:Inc|LLC|Ltd|Corp)?)',
-            r'\bcompany:\s*([A-Z][A-Za-z0-9\s&]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in self.COMPANY_PATTERNS:
+            match = pattern.search(text)
             if match:
                 company = match.group(1).strip()
                 if 2 < len(company) < 50:
@@ -135,13 +221,21 @@ class RedditParser:
         
         return None
     
-    def _has_contact_info(self, text: str) -> bool:
-        """Check if text contains contact information."""
-        has_email = len(self.extract_emails(text)) > 0
-        has_domain = len(self.extract_domains(text)) > 0
-        
-        contact_keywords = ['email', 'contact', 'reach out', 'dm me', 'message me']
-        has_contact_keyword = any(kw in text.lower() for kw in contact_keywords)
-        
-        return has_email or has_domain or has_contact_keyword
+    def _has_contact_info(
+        self,
+        text: str,
+        emails: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None
+    ) -> bool:
+        """Check if text contains contact information (reusing extracted emails/domains if given)."""
+        if emails is None:
+            emails = self.extract_emails(text)
+        if domains is None:
+            domains = self.extract_domains(text)
+        
+        if emails or domains:
+            return True
+        
+        # Single case-insensitive scan, no lowercased copy of the text
+        return bool(text) and self.CONTACT_PATTERN.search(text) is not None
 
@@ -4,9 +4,10 @@ Coordinates rate limiting across all scraper instances to prevent hitting Reddit
 """
 
 import asyncio
+import heapq
+import threading
 import time
-from collections import deque
-from typing import Optional
+from typing import List, Optional
 
 from core.config import get_config
 from core.logger import get_logger
@@ -21,7 +22,7 @@ class GlobalRedditRateLimiter:
     """
     
     _instance: Optional['GlobalRedditRateLimiter'] = None
-    _lock = asyncio.Lock()
+    _instance_lock = threading.Lock()
     
     def __init__(self):
         """Initialize global rate limiter."""
@@ -29,9 +30,13 @@ class GlobalRedditRateLimiter:
         self.max_requests_per_minute = self.config.reddit_max_requests_per_minute
         self.rate_limit_delay = self.config.reddit_rate_limit_delay
         
-        # Track request timestamps (sliding window)
-        self._request_timestamps: deque = deque()
-        self._last_request_time = 0.0
+        # Expiry times (monotonic) of requests in the sliding window, as a min-heap
+        self._window: List[float] = []
+        self._last_request_time = float("-inf")
+        
+        # No request is scheduled before this time (monotonic); set when Reddit
+        # reports its quota is used up or answers 429
+        self._paused_until = float("-inf")
         
         logger.info(
             "Initialized GlobalRedditRateLimiter",
@@ -41,10 +46,26 @@ class GlobalRedditRateLimiter:
     
     @classmethod
     def get_instance(cls) -> 'GlobalRedditRateLimiter':
-        """Get or create singleton instance."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """
+        Get or create singleton instance.
+        
+        Creation is guarded by a threading lock (not an asyncio lock, which
+        would bind to whichever event loop first used it), so scrapers in
+        different threads or loops share one limiter. Once created, the
+        instance is returned without taking the lock.
+        """
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                instance = cls._instance
+        return instance
+    
+    def _prune(self, now: float) -> None:
+        """Drop window entries that have expired by ``now``."""
+        while self._window and self._window[0] <= now:
+            heapq.heappop(self._window)
     
     async def wait_if_needed(self) -> None:
         """
@@ -52,61 +73,73 @@ class GlobalRedditRateLimiter:
         This method:
         1. Enforces per-instance delay (rate_limit_delay)
         2. Enforces global rate limit (max_requests_per_minute)
+        
+        Each caller reserves its own request slot and then sleeps until it.
+        The reservation contains no await, so it runs atomically on the event
+        loop and needs no lock; concurrent callers never queue behind each
+        other's sleeps.
+        """
+        current_time = time.monotonic()
+        
+        # Step 1: Enforce per-instance delay (and any pause requested by Reddit)
+        slot = max(current_time, self._last_request_time + self.rate_limit_delay, self._paused_until)
+        
+        # Step 2: Enforce global rate limit (sliding window)
+        self._prune(slot)
+        window_full = len(self._window) >= self.max_requests_per_minute
+        while len(self._window) >= self.max_requests_per_minute:
+            # Wait for the oldest request to leave the window
+            slot = max(slot, heapq.heappop(self._window) + 0.1)  # Add 0.1s buffer
+            self._prune(slot)
+        
+        # Reserve this request's slot
+        heapq.heappush(self._window, slot + 60.0)
+        self._last_request_time = slot
+        
+        wait_time = slot - current_time
+        
+        if wait_time > 0:
+            if window_full:
+                logger.debug(
+                    "Global rate limit reached, waiting",
+                    wait_seconds=wait_time,
+                    requests_in_window=len(self._window)
+                )
+            await asyncio.sleep(wait_time)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Hold back all requests for a number of seconds.
+        
+        Args:
+            seconds: Seconds from now before the next request may be sent
         """
-        async with self._lock:
-            current_time = time.time()
-            
-            # Step 1: Enforce per-instance delay
-            time_since_last = current_time - self._last_request_time
-            if time_since_last < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - time_since_last
-                await asyncio.sleep(sleep_time)
-                current_time = time.time()
-            
-            # Step 2: Enforce global rate limit (sliding window)
-            # Remove timestamps older than 1 minute
-            one_minute_ago = current_time - 60.0
-            while self._request_timestamps and self._request_timestamps[0] < one_minute_ago:
-                self._request_timestamps.popleft()
-            
-            # Check if we're at the limit
-            if len(self._request_timestamps) >= self.max_requests_per_minute:
-                # Calculate how long to wait
-                oldest_request = self._request_timestamps[0]
-                wait_time = 60.0 - (current_time - oldest_request) + 0.1  # Add 0.1s buffer
-                
-                if wait_time > 0:
-                    logger.debug(
-                        "Global rate limit reached, waiting",
-                        wait_seconds=wait_time,
-                        requests_in_window=len(self._request_timestamps)
-                    )
-                    await asyncio.sleep(wait_time)
-                    current_time = time.time()
-                    
-                    # Clean up old timestamps again after waiting
-                    one_minute_ago = current_time - 60.0
-                    while self._request_timestamps and self._request_timestamps[0] < one_minute_ago:
-                        self._request_timestamps.popleft()
-            
-            # Record this request
-            self._request_timestamps.append(current_time)
-            self._last_request_time = current_time
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            logger.warning("Reddit rate limit exhausted, pausing requests", pause_seconds=seconds)
+    
+    def update_from_headers(self, remaining: Optional[float], reset_seconds: Optional[float]) -> None:
+        """
+        Apply Reddit's X-Ratelimit-Remaining / X-Ratelimit-Reset response headers.
+        
+        Args:
+            remaining: Requests left in Reddit's current window
+            reset_seconds: Seconds until Reddit's window resets
+        """
+        if remaining is not None and reset_seconds is not None and remaining < 1:
+            self.pause(reset_seconds)
     
     def get_stats(self) -> dict:
         """Get current rate limiter statistics."""
-        current_time = time.time()
-        one_minute_ago = current_time - 60.0
-        
-        # Clean up old timestamps
-        while self._request_timestamps and self._request_timestamps[0] < one_minute_ago:
-            self._request_timestamps.popleft()
+        self._prune(time.monotonic())
+        requests_in_window = len(self._window)
         
         return {
-            "requests_in_last_minute": len(self._request_timestamps),
+            "requests_in_last_minute": requests_in_window,
             "max_requests_per_minute": self.max_requests_per_minute,
             "rate_limit_delay": self.rate_limit_delay,
-            "remaining_capacity": max(0, self.max_requests_per_minute - len(self._request_timestamps))
+            "remaining_capacity": max(0, self.max_requests_per_minute - requests_in_window)
         }
 
 
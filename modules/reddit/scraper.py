@@ -1,33 +1,71 @@
 """
-Reddit scraper using AsyncPRAW (Async Python Reddit API Wrapper).
+Reddit scraper using Reddit's OAuth JSON API for subreddit listings and
+comment trees (AsyncPRAW's client is kept for connectivity checks).
 Implements BasePlatformScraper interface.
 """
 
 import asyncio
 import time
+import traceback
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import asyncpraw
-from asyncpraw.models import Comment, Submission
+import httpx
 from asyncprawcore.exceptions import RequestException, ServerError, ResponseException
 from tenacity import (
-    retry,
+    AsyncRetrying,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
+    retry_if_exception,
     RetryError
 )
 
 from core.config import get_config
 from core.logger import get_logger
 from modules.platforms.base import BasePlatformScraper
+from modules.reddit.api_client import get_reddit_api_client
+from modules.reddit.cache import get_response_cache
 from modules.reddit.rate_limiter import get_global_rate_limiter
 from modules.metrics.scraper_metrics import get_metrics_collector, ScrapingMetrics
 from modules.vpn import ensure_vpn_connected
 
 logger = get_logger(__name__)
 
+# HTTP statuses worth retrying: expired token (refetched on retry), timeouts
+# and rate limiting (retries wait out the reset in the rate limiter), plus 5xx
+RETRYABLE_STATUS_CODES = {401, 408, 429}
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Whether a failed Reddit request is transient and worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    if isinstance(error, ResponseException) and not isinstance(error, ServerError):
+        # e.g. Forbidden/NotFound for private or banned subreddits
+        status = error.response.status
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    return isinstance(error, (
+        RequestException,
+        ServerError,
+        httpx.TransportError,
+        ConnectionError,
+        TimeoutError,
+        asyncio.TimeoutError
+    ))
+
+
+# Listing sorts served by /r/{subreddit}/{sort}, mapped to whether they take a
+# time filter; anything else falls back to "new"
+LISTING_SORTS = {
+    "hot": False,
+    "new": False,
+    "top": True,
+    "rising": False,
+}
+
 
 class RedditScraper(BasePlatformScraper):
     """Scrapes Reddit for posts and comments."""
@@ -38,6 +76,26 @@ class RedditScraper(BasePlatformScraper):
         self.config = get_config()
         self._reddit: Optional[asyncpraw.Reddit] = None
         self._global_rate_limiter = get_global_rate_limiter()
+        self._response_cache = get_response_cache()
+        # Shared across scraper instances, so close() leaves it open
+        self._api = get_reddit_api_client()
+        
+        # Retry policy for transient failures, built once and copied per call
+        # (an AsyncRetrying keeps its attempt state on the instance)
+        self._retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.config.reddit_retry_attempts),
+            wait=wait_exponential(
+                multiplier=self.config.reddit_retry_delay,
+                min=self.config.reddit_retry_delay,
+                max=30.0
+            ),
+            retry=retry_if_exception(_is_retryable_error),
+            reraise=True
+        )
+        
+        # Profile URLs by author name (the same authors recur across posts/comments);
+        # deleted authors have no profile
+        self._author_url_cache: Dict[str, Optional[str]] = {"[deleted]": None}
         
         # Ensure VPN is connected if enabled (before any requests)
         if self.config.vpn_enabled:
@@ -105,6 +163,11 @@ class RedditScraper(BasePlatformScraper):
         """
         await self._global_rate_limiter.wait_if_needed()
     
+    async def _fetch_listing_page(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of a listing (rate limited) and return its "data"."""
+        await self._rate_limit()
+        return (await self._api.get(path, params))["data"]
+    
     async def _scrape_subreddit_with_retry(
         self,
         subreddit_name: str,
@@ -124,28 +187,90 @@ class RedditScraper(BasePlatformScraper):
         Returns:
             List of post dictionaries
         """
-        await self._rate_limit()
+        return [
+            post
+            async for batch in self.iter_subreddit(
+                subreddit_name=subreddit_name,
+                limit=limit,
+                time_filter=time_filter,
+                sort=sort
+            )
+            for post in batch
+        ]
+    
+    async def iter_subreddit(
+        self,
+        subreddit_name: str,
+        limit: int = 100,
+        time_filter: str = "day",
+        sort: str = "new",
+        batch_size: int = 32
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream posts from a subreddit in batches as the listing is paged in.
         
-        subreddit = await self.reddit.subreddit(subreddit_name)
-        
-        # Get posts based on sort method
-        if sort == "hot":
-            posts = subreddit.hot(limit=limit)
-        elif sort == "new":
-            posts = subreddit.new(limit=limit)
-        elif sort == "top":
-            posts = subreddit.top(time_filter=time_filter, limit=limit)
-        elif sort == "rising":
-            posts = subreddit.rising(limit=limit)
-        else:
-            posts = subreddit.new(limit=limit)
+        Listings are read straight from Reddit's JSON API (one request per
+        page of up to 100 posts), which already carries every field the post
+        dictionaries need.
+        
+        The next page is requested before the current one is yielded, so
+        consumers (e.g. database writers) work on a batch while the next
+        one is fetched. Unlike scrape_subreddit this neither retries nor
+        caches: batches already yielded cannot be taken back, so errors
+        propagate to the caller.
         
-        scraped_posts = []
-        async for post in posts:
-            post_data = await self._extract_post_data(post)
-            scraped_posts.append(post_data)
+        Args:
+            subreddit_name: Name of subreddit
+            limit: Maximum number of posts to fetch
+            time_filter: Time filter (hour, day, week, month, year, all)
+            sort: Sort method (hot, new, top, rising)
+            batch_size: Number of posts per yielded batch
+            
+        Yields:
+            Lists of post dictionaries
+        """
+        if sort not in LISTING_SORTS:
+            sort = "new"
+        
+        path = f"/r/{subreddit_name}/{sort}"
+        params: Dict[str, Any] = {"raw_json": 1}
+        if LISTING_SORTS[sort]:
+            params["t"] = time_filter
         
-        return scraped_posts
+        if limit <= 0:
+            return
+        
+        remaining = limit
+        batch = []
+        next_page = asyncio.create_task(self._fetch_listing_page(path, dict(params, limit=min(remaining, 100))))
+        
+        try:
+            while next_page is not None:
+                listing = await next_page
+                next_page = None
+                children = listing["children"]
+                remaining -= len(children)
+                
+                # Request the following page before extracting/yielding this
+                # one, so the fetch overlaps with the consumer's work
+                if children and listing.get("after") and remaining > 0:
+                    params["after"] = listing["after"]
+                    next_page = asyncio.create_task(
+                        self._fetch_listing_page(path, dict(params, limit=min(remaining, 100)))
+                    )
+                
+                for child in children:
+                    batch.append(self._extract_post_data(child["data"]))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        finally:
+            # Consumer stopped early or a page failed; drop the prefetch
+            if next_page is not None:
+                next_page.cancel()
+        
+        if batch:
+            yield batch
     
     async def scrape_subreddit(
         self,
@@ -168,35 +293,28 @@ class RedditScraper(BasePlatformScraper):
         Returns:
             List of post dictionaries
         """
-        # Retry decorator for transient failures
-        @retry(
-            stop=stop_after_attempt(self.config.reddit_retry_attempts),
-            wait=wait_exponential(
-                multiplier=self.config.reddit_retry_delay,
-                min=self.config.reddit_retry_delay,
-                max=30.0
-            ),
-            retry=retry_if_exception_type((
-                RequestException,
-                ServerError,
-                ResponseException,
-                ConnectionError,
-                TimeoutError,
-                asyncio.TimeoutError
-            )),
-            reraise=True
-        )
-        async def _retry_scrape():
-            return await self._scrape_subreddit_with_retry(
-                subreddit_name=subreddit_name,
-                limit=limit,
-                time_filter=time_filter,
+        cache_key = ("listing", subreddit_name, sort, time_filter, limit)
+        cached_posts = await self._response_cache.get(cache_key)
+        if cached_posts is not None:
+            logger.info(
+                "Using cached subreddit listing",
+                subreddit=subreddit_name,
+                post_count=len(cached_posts),
                 sort=sort
             )
+            return cached_posts
         
         retry_count = 0
         try:
-            scraped_posts = await _retry_scrape()
+            async for attempt in self._retrying.copy():
+                with attempt:
+                    scraped_posts = await self._scrape_subreddit_with_retry(
+                        subreddit_name=subreddit_name,
+                        limit=limit,
+                        time_filter=time_filter,
+                        sort=sort
+                    )
+            await self._response_cache.set(cache_key, scraped_posts)
             
             logger.info(
                 "Scraped subreddit",
@@ -213,7 +331,6 @@ class RedditScraper(BasePlatformScraper):
             retry_count = self.config.reddit_retry_attempts
             error = e.last_attempt.exception() if e.last_attempt else e
             
-            import traceback
             logger.error(
                 "Failed to scrape subreddit after retries",
                 subreddit=subreddit_name,
@@ -225,8 +342,6 @@ class RedditScraper(BasePlatformScraper):
             return []
             
         except Exception as e:
-            import traceback
-            
             underlying_error = None
             if isinstance(e, RequestException):
                 if hasattr(e, 'original_exception'):
@@ -268,22 +383,27 @@ class RedditScraper(BasePlatformScraper):
         """
         await self._rate_limit()
         
-        submission = await self.reddit.submission(id=post_id)
-        
-        # Replace "MoreComments" objects with actual comments
-        await submission.comments.replace_more(limit=0)
+        # Response is [post listing, comment listing]
+        _, comment_listing = await self._api.get(f"/comments/{post_id}", {"raw_json": 1})
         
         comments = []
-        comment_count = 0
         
-        for comment in await submission.comments.list():
-            if limit and comment_count >= limit:
+        # Walk the comment tree breadth-first, skipping "load more" stubs
+        queue = deque(comment_listing["data"]["children"])
+        while queue:
+            if limit and len(comments) >= limit:
                 break
             
-            if isinstance(comment, Comment):
-                comment_data = await self._extract_comment_data(comment, post_id)
-                comments.append(comment_data)
-                comment_count += 1
+            child = queue.popleft()
+            if child["kind"] != "t1":
+                continue
+            
+            comment = child["data"]
+            comments.append(self._extract_comment_data(comment, post_id))
+            
+            replies = comment.get("replies")
+            if replies:
+                queue.extend(replies["data"]["children"])
         
         return comments
     
@@ -302,29 +422,21 @@ class RedditScraper(BasePlatformScraper):
         Returns:
             List of comment dictionaries
         """
-        # Retry decorator for transient failures
-        @retry(
-            stop=stop_after_attempt(self.config.reddit_retry_attempts),
-            wait=wait_exponential(
-                multiplier=self.config.reddit_retry_delay,
-                min=self.config.reddit_retry_delay,
-                max=30.0
-            ),
-            retry=retry_if_exception_type((
-                RequestException,
-                ServerError,
-                ResponseException,
-                ConnectionError,
-                TimeoutError,
-                asyncio.TimeoutError
-            )),
-            reraise=True
-        )
-        async def _retry_scrape():
-            return await self._scrape_post_comments_with_retry(post_id, limit)
+        cache_key = ("comments", post_id, limit)
+        cached_comments = await self._response_cache.get(cache_key)
+        if cached_comments is not None:
+            logger.info(
+                "Using cached post comments",
+                post_id=post_id,
+                comment_count=len(cached_comments)
+            )
+            return cached_comments
         
         try:
-            comments = await _retry_scrape()
+            async for attempt in self._retrying.copy():
+                with attempt:
+                    comments = await self._scrape_post_comments_with_retry(post_id, limit)
+            await self._response_cache.set(cache_key, comments)
             
             logger.info(
                 "Scraped post comments",
@@ -336,7 +448,6 @@ class RedditScraper(BasePlatformScraper):
             
         except RetryError as e:
             error = e.last_attempt.exception() if e.last_attempt else e
-            import traceback
             logger.error(
                 "Failed to scrape post comments after retries",
                 post_id=post_id,
@@ -348,7 +459,6 @@ class RedditScraper(BasePlatformScraper):
             return []
             
         except Exception as e:
-            import traceback
             logger.error(
                 "Failed to scrape post comments",
                 post_id=post_id,
@@ -366,6 +476,8 @@ class RedditScraper(BasePlatformScraper):
         """
         Scrape posts from Reddit (implements BasePlatformScraper).
         Implements partial result recovery - continues even if one subreddit fails.
+        Subreddits are scraped concurrently, up to reddit_max_concurrent_subreddits
+        at a time.
         
         If subreddits is empty, searches across all of Reddit using r/all.
         
@@ -386,52 +498,68 @@ class RedditScraper(BasePlatformScraper):
             subreddits = ["all"]
             logger.info("No subreddits specified, searching all of Reddit", search_id=search_id)
         
-        all_posts = []
-        metrics_collector = get_metrics_collector()
-        
-        for subreddit in subreddits:
-            metrics = ScrapingMetrics(
-                search_id=search_id or "unknown",
-                platform="reddit",
-                subreddit=subreddit,
-                start_time=datetime.utcnow()
-            )
-            
-            try:
-                posts = await self.scrape_subreddit(
-                    subreddit_name=subreddit,
-                    limit=limit,
-                    time_filter=time_filter,
-                    sort=sort,
-                    search_id=search_id
+        semaphore = asyncio.Semaphore(self.config.reddit_max_concurrent_subreddits)
+        
+        async def _scrape_one(subreddit: str) -> Tuple[List[Dict[str, Any]], ScrapingMetrics]:
+            async with semaphore:
+                metrics = ScrapingMetrics(
+                    search_id=search_id or "unknown",
+                    platform="reddit",
+                    subreddit=subreddit,
+                    start_time=datetime.utcnow()
                 )
+                posts: List[Dict[str, Any]] = []
+                
+                try:
+                    posts = await self.scrape_subreddit(
+                        subreddit_name=subreddit,
+                        limit=limit,
+                        time_filter=time_filter,
+                        sort=sort,
+                        search_id=search_id
+                    )
+                    
+                    metrics.posts_scraped = len(posts)
+                    metrics.subreddits_succeeded = 1
+                    
+                except Exception as e:
+                    metrics.posts_failed = limit  # Estimate
+                    metrics.subreddits_failed = 1
+                    metrics.errors.append(f"{type(e).__name__}: {str(e)}")
+                    
+                    logger.warning(
+                        "Failed to scrape subreddit, continuing with others",
+                        subreddit=subreddit,
+                        error=str(e)
+                    )
                 
-                metrics.posts_scraped = len(posts)
-                metrics.subreddits_succeeded = 1
-                all_posts.extend(posts)
+                finally:
+                    metrics.end_time = datetime.utcnow()
                 
+                return posts, metrics
+        
+        # Scrape subreddits concurrently (the global rate limiter still paces
+        # the actual API calls); results are folded in subreddit order. A single
+        # subreddit (including the r/all default) is awaited directly.
+        if len(subreddits) == 1:
+            results = [await _scrape_one(subreddits[0])]
+        else:
+            results = await asyncio.gather(*(_scrape_one(subreddit) for subreddit in subreddits))
+        
+        all_posts = []
+        for subreddit, (posts, metrics) in zip(subreddits, results):
+            all_posts.extend(posts)
+            
+            if metrics.subreddits_succeeded:
                 logger.info(
                     "Successfully scraped subreddit",
                     subreddit=subreddit,
                     posts=len(posts),
                     total_posts=len(all_posts)
                 )
-                
-            except Exception as e:
-                metrics.posts_failed = limit  # Estimate
-                metrics.subreddits_failed = 1
-                metrics.errors.append(f"{type(e).__name__}: {str(e)}")
-                
-                logger.warning(
-                    "Failed to scrape subreddit, continuing with others",
-                    subreddit=subreddit,
-                    error=str(e),
-                    total_posts_so_far=len(all_posts)
-                )
-            
-            finally:
-                metrics.end_time = datetime.utcnow()
-                metrics_collector.record_metrics(metrics)
+        
+        # Record all subreddits' metrics in one batch
+        get_metrics_collector().record_metrics_bulk([result[-1] for result in results])
         
         logger.info(
             "Completed scraping posts",
@@ -467,6 +595,8 @@ class RedditScraper(BasePlatformScraper):
         """
         Scrape posts and comments (implements BasePlatformScraper).
         Implements partial result recovery - continues even if one subreddit/post fails.
+        Subreddits are scraped concurrently, up to reddit_max_concurrent_subreddits
+        at a time.
         
         If subreddits is empty, searches across all of Reddit using r/all.
         
@@ -489,52 +619,98 @@ class RedditScraper(BasePlatformScraper):
             subreddits = ["all"]
             logger.info("No subreddits specified, searching all of Reddit", search_id=search_id)
         
-        all_posts = []
-        all_comments = []
-        metrics_collector = get_metrics_collector()
-        
-        for subreddit in subreddits:
-            metrics = ScrapingMetrics(
-                search_id=search_id or "unknown",
-                platform="reddit",
-                subreddit=subreddit,
-                start_time=datetime.utcnow()
-            )
-            
-            try:
-                # Scrape posts for this subreddit
-                posts = await self.scrape_subreddit(
-                    subreddit_name=subreddit,
-                    limit=post_limit,
-                    time_filter=time_filter,
-                    sort=sort,
-                    search_id=search_id
+        semaphore = asyncio.Semaphore(self.config.reddit_max_concurrent_subreddits)
+        comment_semaphore = asyncio.Semaphore(self.config.reddit_max_concurrent_comment_fetches)
+        
+        async def _scrape_comments(post: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with comment_semaphore:
+                return await self.scrape_post_comments(
+                    post_id=post["id"],
+                    limit=comment_limit
+                )
+        
+        async def _scrape_one(
+            subreddit: str
+        ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], ScrapingMetrics]:
+            async with semaphore:
+                metrics = ScrapingMetrics(
+                    search_id=search_id or "unknown",
+                    platform="reddit",
+                    subreddit=subreddit,
+                    start_time=datetime.utcnow()
                 )
-                all_posts.extend(posts)
-                metrics.posts_scraped = len(posts)
+                posts: List[Dict[str, Any]] = []
+                subreddit_comments: List[Dict[str, Any]] = []
                 
-                # Scrape comments if enabled
-                if include_comments:
-                    for post in posts:
-                        try:
-                            comments = await self.scrape_post_comments(
-                                post_id=post["id"],
-                                limit=comment_limit
-                            )
-                            all_comments.extend(comments)
-                            metrics.comments_scraped += len(comments)
-                        except Exception as e:
-                            metrics.comments_failed += 1
-                            metrics.errors.append(f"Post {post['id']}: {str(e)}")
-                            logger.warning(
-                                "Failed to scrape comments for post, continuing",
-                                post_id=post["id"],
-                                subreddit=subreddit,
-                                error=str(e)
-                            )
+                try:
+                    # Scrape posts for this subreddit
+                    posts = await self.scrape_subreddit(
+                        subreddit_name=subreddit,
+                        limit=post_limit,
+                        time_filter=time_filter,
+                        sort=sort,
+                        search_id=search_id
+                    )
+                    metrics.posts_scraped = len(posts)
+                    
+                    # Scrape comments if enabled (posts fetched concurrently). The
+                    # listing already reports each post's comment count, so posts
+                    # without comments are not fetched again.
+                    commented_posts = [
+                        post for post in posts if post.get("num_comments", 1) > 0
+                    ] if include_comments else []
+                    if commented_posts:
+                        comment_results = await asyncio.gather(
+                            *(_scrape_comments(post) for post in commented_posts),
+                            return_exceptions=True
+                        )
+                        for post, result in zip(commented_posts, comment_results):
+                            if isinstance(result, Exception):
+                                metrics.comments_failed += 1
+                                metrics.errors.append(f"Post {post['id']}: {str(result)}")
+                                logger.warning(
+                                    "Failed to scrape comments for post, continuing",
+                                    post_id=post["id"],
+                                    subreddit=subreddit,
+                                    error=str(result)
+                                )
+                            else:
+                                subreddit_comments.extend(result)
+                                metrics.comments_scraped += len(result)
+                    
+                    metrics.subreddits_succeeded = 1
+                    
+                except Exception as e:
+                    metrics.posts_failed = post_limit  # Estimate
+                    metrics.subreddits_failed = 1
+                    metrics.errors.append(f"{type(e).__name__}: {str(e)}")
+                    
+                    logger.warning(
+                        "Failed to scrape subreddit, continuing with others",
+                        subreddit=subreddit,
+                        error=str(e)
+                    )
                 
-                metrics.subreddits_succeeded = 1
+                finally:
+                    metrics.end_time = datetime.utcnow()
                 
+                return posts, subreddit_comments, metrics
+        
+        # Scrape subreddits concurrently (the global rate limiter still paces
+        # the actual API calls); results are folded in subreddit order. A single
+        # subreddit (including the r/all default) is awaited directly.
+        if len(subreddits) == 1:
+            results = [await _scrape_one(subreddits[0])]
+        else:
+            results = await asyncio.gather(*(_scrape_one(subreddit) for subreddit in subreddits))
+        
+        all_posts = []
+        all_comments = []
+        for subreddit, (posts, comments, metrics) in zip(subreddits, results):
+            all_posts.extend(posts)
+            all_comments.extend(comments)
+            
+            if metrics.subreddits_succeeded:
                 logger.info(
                     "Successfully scraped subreddit with comments",
                     subreddit=subreddit,
@@ -543,23 +719,9 @@ class RedditScraper(BasePlatformScraper):
                     total_posts=len(all_posts),
                     total_comments=len(all_comments)
                 )
-                
-            except Exception as e:
-                metrics.posts_failed = post_limit  # Estimate
-                metrics.subreddits_failed = 1
-                metrics.errors.append(f"{type(e).__name__}: {str(e)}")
-                
-                logger.warning(
-                    "Failed to scrape subreddit, continuing with others",
-                    subreddit=subreddit,
-                    error=str(e),
-                    total_posts_so_far=len(all_posts),
-                    total_comments_so_far=len(all_comments)
-                )
-            
-            finally:
-                metrics.end_time = datetime.utcnow()
-                metrics_collector.record_metrics(metrics)
+        
+        # Record all subreddits' metrics in one batch
+        get_metrics_collector().record_metrics_bulk([result[-1] for result in results])
         
         logger.info(
             "Completed scraping with comments",
@@ -598,13 +760,21 @@ class RedditScraper(BasePlatformScraper):
             sort=sort
         )
         
-        all_comments = []
-        for post in posts:
-            comments = await self.scrape_post_comments(
-                post_id=post["id"],
-                limit=comment_limit
-            )
-            all_comments.extend(comments)
+        # Fetch comment trees concurrently (bounded), skipping posts the
+        # listing reports as having no comments
+        semaphore = asyncio.Semaphore(self.config.reddit_max_concurrent_comment_fetches)
+        
+        async def _scrape_comments(post: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_post_comments(
+                    post_id=post["id"],
+                    limit=comment_limit
+                )
+        
+        results = await asyncio.gather(
+            *(_scrape_comments(post) for post in posts if post.get("num_comments", 1) > 0)
+        )
+        all_comments = [comment for comments in results for comment in comments]
         
         logger.info(
             "Scraped subreddit with comments",
@@ -615,51 +785,53 @@ class RedditScraper(BasePlatformScraper):
         
         return posts, all_comments
     
-    async def _extract_post_data(self, post: Submission) -> Dict[str, Any]:
-        """Extract data from a Reddit post."""
-        author_name = str(post.author) if post.author else "[deleted]"
-        author_profile_url = None
-        
-        if post.author and str(post.author) != "[deleted]":
-            author_profile_url = f"https://www.reddit.com/user/{post.author}"
+    def _get_author_profile_url(self, author_name: str) -> Optional[str]:
+        """Get the profile URL for an author (None if deleted), cached per author name."""
+        try:
+            return self._author_url_cache[author_name]
+        except KeyError:
+            url = self._author_url_cache[author_name] = f"https://www.reddit.com/user/{author_name}"
+            return url
+    
+    def _extract_post_data(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract data from a Reddit post (the "data" of a listing child)."""
+        author_name = post.get("author") or "[deleted]"
         
         return {
-            "id": post.id,
-            "title": post.title,
-            "content": post.selftext,
+            "id": post["id"],
+            "title": post["title"],
+            "content": post["selftext"],
             "author": author_name,
-            "author_profile_url": author_profile_url,
-            "subreddit": str(post.subreddit),
-            "url": f"https://reddit.com{post.permalink}",
-            "score": post.score,
-            "num_comments": post.num_comments,
-            "created_utc": datetime.fromtimestamp(post.created_utc),
-            "is_self": post.is_self,
-            "link_url": post.url if not post.is_self else None,
+            "author_profile_url": self._get_author_profile_url(author_name),
+            "subreddit": post["subreddit"],
+            "url": f"https://reddit.com{post['permalink']}",
+            "score": post["score"],
+            "num_comments": post["num_comments"],
+            "created_utc": datetime.fromtimestamp(post["created_utc"]),
+            "created_utc_ts": post["created_utc"],
+            "is_self": post["is_self"],
+            "link_url": post["url"] if not post["is_self"] else None,
             "source": "reddit",
             "source_type": "post"
         }
     
-    async def _extract_comment_data(self, comment: Comment, post_id: str) -> Dict[str, Any]:
-        """Extract data from a Reddit comment."""
-        author_name = str(comment.author) if comment.author else "[deleted]"
-        author_profile_url = None
-        
-        if comment.author and str(comment.author) != "[deleted]":
-            author_profile_url = f"https://www.reddit.com/user/{comment.author}"
+    def _extract_comment_data(self, comment: Dict[str, Any], post_id: str) -> Dict[str, Any]:
+        """Extract data from a Reddit comment (the "data" of a t1 thing)."""
+        author_name = comment.get("author") or "[deleted]"
         
         return {
-            "id": comment.id,
-            "content": comment.body,
+            "id": comment["id"],
+            "content": comment["body"],
             "author": author_name,
-            "author_profile_url": author_profile_url,
-            "subreddit": str(comment.subreddit),
-            "url": f"https://reddit.com{comment.permalink}",
-            "score": comment.score,
-            "created_utc": datetime.fromtimestamp(comment.created_utc),
+            "author_profile_url": self._get_author_profile_url(author_name),
+            "subreddit": comment["subreddit"],
+            "url": f"https://reddit.com{comment['permalink']}",
+            "score": comment["score"],
+            "created_utc": datetime.fromtimestamp(comment["created_utc"]),
+            "created_utc_ts": comment["created_utc"],
             "parent_post_id": post_id,
-            "parent_id": comment.parent_id,
-            "is_top_level": comment.parent_id.startswith("t3_"),
+            "parent_id": comment["parent_id"],
+            "is_top_level": comment["parent_id"].startswith("t3_"),
             "source": "reddit",
             "source_type": "comment"
         }
@@ -4,14 +4,16 @@ Uses APScheduler to periodically check and process due searches.
 """
 
 import asyncio
+import logging
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from core.config import get_config
-from core.logger import get_logger
+from core.logger import Lazy, get_logger
 from core.processor import process_keyword_search
 from modules.database.storage import LeadStorage
 from modules.keywords.manager import KeywordSearchManager
@@ -19,6 +21,9 @@ from modules.jobs.tracker import get_job_tracker
 
 logger = get_logger(__name__)
 
+# Maximum due-search ids/names included in the per-check log event
+LOG_PREVIEW_SIZE = 10
+
 
 class RixlyScheduler:
     """Scheduler for automated keyword search processing."""
@@ -41,11 +46,11 @@ class RixlyScheduler:
     async def process_due_searches(self):
         """Process all keyword searches that are due for scraping."""
         try:
-            # Get statistics about all searches
-            all_searches = self.storage.list_keyword_searches(enabled_only=False, limit=1000)
-            total_searches = len(all_searches)
-            enabled_searches = sum(1 for s in all_searches if s.enabled)
-            scheduled_searches = sum(1 for s in all_searches if s.scraping_mode == "scheduled" and s.enabled)
+            # Get statistics about all searches (counted in the database)
+            search_counts = self.storage.get_search_counts()
+            total_searches = search_counts["total"]
+            enabled_searches = search_counts["enabled"]
+            scheduled_searches = search_counts["scheduled_enabled"]
             
             logger.info(
                 "Scheduler check started",
@@ -67,170 +72,48 @@ class RixlyScheduler:
                 )
                 return
             
+            # The id/name previews are only built if the event is emitted, and
+            # are capped so the log line stays small however many searches are due
             logger.info(
                 "Found searches due for processing",
                 due_count=len(due_searches),
-                search_ids=[s.id for s in due_searches],
-                search_names=[s.name for s in due_searches]
+                search_ids_preview=Lazy(lambda: [s.id for s in due_searches[:LOG_PREVIEW_SIZE]]),
+                search_names_preview=Lazy(lambda: [s.name for s in due_searches[:LOG_PREVIEW_SIZE]]),
+                search_ids_truncated=max(0, len(due_searches) - LOG_PREVIEW_SIZE)
             )
             
             job_tracker = get_job_tracker(self.storage)
             
+            # Check running jobs and cooldowns for all due searches at once
+            blocked = job_tracker.get_blocked_ids([s.id for s in due_searches])
+            semaphore = asyncio.Semaphore(self.config.scheduler_max_concurrent_searches)
+            
+            async def _process_one(search) -> Tuple[str, int]:
+                async with semaphore:
+                    return await self._process_search(search, job_tracker, blocked.get(search.id))
+            
+            # Process due searches concurrently (scrapes are network-bound);
+            # each returns its outcome and the number of leads created
+            results = await asyncio.gather(*(_process_one(search) for search in due_searches))
+            
             # Track processing statistics
-            processed_count = 0
-            skipped_count = 0
-            failed_count = 0
+            status_counts = Counter()
             total_leads_created = 0
-            
-            for search in due_searches:
-                try:
-                    # Check if job can be started (not running and cooldown passed)
-                    can_start, reason = job_tracker.can_start_job(search.id)
-                    
-                    if not can_start:
-                        skipped_count += 1
-                        logger.info(
-                            "Skipping search - job conflict or cooldown",
-                            search_id=search.id,
-                            search_name=search.name,
-                            reason=reason,
-                            next_scrape_at=search.next_scrape_at.isoformat() if search.next_scrape_at else None,
-                            last_scrape_at=search.last_scrape_at.isoformat() if search.last_scrape_at else None
-                        )
-                        continue
-                    
-                    # Start job tracking
-                    if not job_tracker.start_job(search.id):
-                        logger.warning(
-                            "Failed to start job for search",
-                            search_id=search.id
-                        )
-                        continue
-                    
-                    logger.info(
-                        "Starting keyword search processing",
-                        search_id=search.id,
-                        name=search.name,
-                        platforms=search.platforms,
-                        scraping_mode=search.scraping_mode,
-                        scraping_interval=search.scraping_interval,
-                        keywords_count=len(search.keywords),
-                        patterns_count=len(search.patterns),
-                        next_scrape_at=search.next_scrape_at.isoformat() if search.next_scrape_at else None
-                    )
-                    
-                    # Update database with job status
-                    try:
-                        from core.state import KeywordSearchState
-                        search_model = self.storage.get_keyword_search(search.id)
-                        if search_model:
-                            search_state = KeywordSearchState(
-                                id=search_model.id,
-                                name=search_model.name,
-                                keywords=search_model.keywords,
-                                patterns=search_model.patterns,
-                                platforms=search_model.platforms,
-                                reddit_config=search_model.reddit_config,
-                                linkedin_config=search_model.linkedin_config,
-                                twitter_config=search_model.twitter_config,
-                                scraping_mode=search_model.scraping_mode,
-                                scraping_interval=search_model.scraping_interval,
-                                enabled=search_model.enabled,
-                                created_at=search_model.created_at,
-                                updated_at=datetime.utcnow(),
-                                last_scrape_at=search_model.last_scrape_at,
-                                next_scrape_at=search_model.next_scrape_at,
-                                scraping_status="running",
-                                scraping_started_at=datetime.utcnow(),
-                                scraping_completed_at=None,
-                                scraping_error=None
-                            )
-                            self.storage.save_keyword_search(search_state)
-                    except Exception as e:
-                        logger.warning("Failed to update job status in database", search_id=search.id, error=str(e))
-                    
-                    # Process the search
-                    process_start_time = datetime.utcnow()
-                    result = await process_keyword_search(search, self.storage)
-                    process_duration = (datetime.utcnow() - process_start_time).total_seconds()
-                    
-                    # Extract result statistics
-                    posts_scraped = result.get("posts_scraped", 0)
-                    comments_scraped = result.get("comments_scraped", 0)
-                    leads_created = result.get("leads_created", 0)
-                    total_leads_created += leads_created
-                    
-                    # Mark as scraped and completed
-                    self.manager.mark_scraped(search.id)
-                    job_tracker.complete_job(search.id, success=True)
-                    
-                    # Update database with completion
-                    try:
-                        search_model = self.storage.get_keyword_search(search.id)
-                        if search_model:
-                            search_state = KeywordSearchState(
-                                id=search_model.id,
-                                name=search_model.name,
-                                keywords=search_model.keywords,
-                                patterns=search_model.patterns,
-                                platforms=search_model.platforms,
-                                reddit_config=search_model.reddit_config,
-                                linkedin_config=search_model.linkedin_config,
-                                twitter_config=search_model.twitter_config,
-                                scraping_mode=search_model.scraping_mode,
-                                scraping_interval=search_model.scraping_interval,
-                                enabled=search_model.enabled,
-                                created_at=search_model.created_at,
-                                updated_at=datetime.utcnow(),
-                                last_scrape_at=search_model.last_scrape_at,
-                                next_scrape_at=search_model.next_scrape_at,
-                                scraping_status="completed",
-                                scraping_started_at=search_model.scraping_started_at,
-                                scraping_completed_at=datetime.utcnow(),
-                                scraping_error=None
-                            )
-                            self.storage.save_keyword_search(search_state)
-                    except Exception as e:
-                        logger.warning("Failed to update completion status in database", search_id=search.id, error=str(e))
-                    
-                    processed_count += 1
-                    logger.info(
-                        "Completed keyword search processing",
-                        search_id=search.id,
-                        search_name=search.name,
-                        posts_scraped=posts_scraped,
-                        comments_scraped=comments_scraped,
-                        leads_created=leads_created,
-                        processing_time_seconds=round(process_duration, 2),
-                        next_scrape_at=search.next_scrape_at.isoformat() if search.next_scrape_at else None
-                    )
-                    
-                except Exception as e:
-                    failed_count += 1
-                    error_msg = str(e)
-                    # Only complete job if we started tracking it
-                    if job_tracker.is_job_running(search.id):
-                        job_tracker.complete_job(search.id, success=False, error=error_msg)
-                    
-                    logger.error(
-                        "Failed to process keyword search",
-                        search_id=search.id,
-                        search_name=search.name,
-                        error=error_msg,
-                        error_type=type(e).__name__
-                    )
+            for status, leads_created in results:
+                status_counts[status] += 1
+                total_leads_created += leads_created
             
             # Log summary
             logger.info(
                 "Scheduler check completed",
                 total_due=len(due_searches),
-                processed=processed_count,
-                skipped=skipped_count,
-                failed=failed_count,
+                processed=status_counts["processed"],
+                skipped=status_counts["skipped"],
+                failed=status_counts["failed"],
                 total_leads_created=total_leads_created,
                 next_check_in_seconds=self.config.scheduler_check_interval
             )
-                    
+        
         except Exception as e:
             logger.error(
                 "Failed to process due searches",
@@ -238,6 +121,131 @@ class RixlyScheduler:
                 error_type=type(e).__name__
             )
     
+    async def _process_search(
+        self,
+        search,
+        job_tracker,
+        blocked_reason: Optional[str] = None
+    ) -> Tuple[str, int]:
+        """
+        Process a single due keyword search with job tracking.
+        
+        Args:
+            search: Due keyword search
+            job_tracker: Job tracker guarding against overlapping runs
+            blocked_reason: Why the search cannot start (job running or
+                cooldown), as found by JobTracker.get_blocked_ids
+            
+        Returns:
+            Tuple of (status, leads_created) where status is "processed",
+            "skipped" or "failed"
+        """
+        # Skip building log kwargs (ISO timestamps etc.) when INFO is filtered out
+        info_enabled = logger.is_enabled_for(logging.INFO)
+        next_scrape_at = search.next_scrape_at.isoformat() if info_enabled and search.next_scrape_at else None
+        
+        try:
+            # Skip if a job is running or the cooldown has not passed
+            reason = blocked_reason
+            
+            if reason:
+                if info_enabled:
+                    logger.info(
+                        "Skipping search - job conflict or cooldown",
+                        search_id=search.id,
+                        search_name=search.name,
+                        reason=reason,
+                        next_scrape_at=next_scrape_at,
+                        last_scrape_at=search.last_scrape_at.isoformat() if search.last_scrape_at else None
+                    )
+                return "skipped", 0
+            
+            # Start job tracking
+            if not job_tracker.start_job(search.id):
+                logger.warning(
+                    "Failed to start job for search",
+                    search_id=search.id
+                )
+                return "skipped", 0
+            
+            if info_enabled:
+                logger.info(
+                    "Starting keyword search processing",
+                    search_id=search.id,
+                    name=search.name,
+                    platforms=search.platforms,
+                    scraping_mode=search.scraping_mode,
+                    scraping_interval=search.scraping_interval,
+                    keywords_count=len(search.keywords),
+                    patterns_count=len(search.patterns),
+                    next_scrape_at=next_scrape_at
+                )
+            
+            # One timestamp per phase: start (running) and end (completed)
+            process_start_time = datetime.utcnow()
+            
+            # Update database with job status
+            try:
+                self.storage.update_scrape_status(
+                    search.id,
+                    "running",
+                    started_at=process_start_time
+                )
+            except Exception as e:
+                logger.warning("Failed to update job status in database", search_id=search.id, error=str(e))
+            
+            # Process the search
+            result = await process_keyword_search(search, self.storage)
+            process_end_time = datetime.utcnow()
+            process_duration = (process_end_time - process_start_time).total_seconds()
+            
+            # Extract result statistics
+            posts_scraped = result.get("posts_scraped", 0)
+            comments_scraped = result.get("comments_scraped", 0)
+            leads_created = result.get("leads_created", 0)
+            
+            # Mark as scraped and completed
+            self.manager.mark_scraped(search.id)
+            job_tracker.complete_job(search.id, success=True)
+            
+            # Update database with completion
+            try:
+                self.storage.update_scrape_status(
+                    search.id,
+                    "completed",
+                    completed_at=process_end_time
+                )
+            except Exception as e:
+                logger.warning("Failed to update completion status in database", search_id=search.id, error=str(e))
+            
+            if info_enabled:
+                logger.info(
+                    "Completed keyword search processing",
+                    search_id=search.id,
+                    search_name=search.name,
+                    posts_scraped=posts_scraped,
+                    comments_scraped=comments_scraped,
+                    leads_created=leads_created,
+                    processing_time_seconds=round(process_duration, 2),
+                    next_scrape_at=next_scrape_at
+                )
+            return "processed", leads_created
+        
+        except Exception as e:
+            error_msg = str(e)
+            # Only complete job if we started tracking it
+            if job_tracker.is_job_running(search.id):
+                job_tracker.complete_job(search.id, success=False, error=error_msg)
+            
+            logger.error(
+                "Failed to process keyword search",
+                search_id=search.id,
+                search_name=search.name,
+                error=error_msg,
+                error_type=type(e).__name__
+            )
+            return "failed", 0
+    
     def start(self):
         """Start the scheduler."""
         if self._running:
@@ -248,14 +256,18 @@ class RixlyScheduler:
             logger.info("Scheduler is disabled in config")
             return
         
-        # Schedule periodic check
+        # Schedule periodic check. A check that overruns the interval is never
+        # overlapped by the next one; missed runs collapse into a single late run.
         check_interval = self.config.scheduler_check_interval
         self.scheduler.add_job(
             self.process_due_searches,
             trigger=IntervalTrigger(seconds=check_interval),
             id="process_due_searches",
             name="Process due keyword searches",
-            replace_existing=True
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=check_interval
         )
         
         # Start scheduler
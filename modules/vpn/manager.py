@@ -17,8 +17,10 @@ Important:
 - The VPN connection is persistent for the lifetime of the container
 """
 
+import logging
 import os
 import subprocess
+import threading
 from typing import Optional, Any
 from core.config import get_config
 from core.logger import get_logger
@@ -28,6 +30,11 @@ logger = get_logger(__name__)
 # Global VPN instance
 _vpn_instance: Optional[Any] = None
 
+# Guard instance creation and interface bring-up (threading locks, since
+# callers may run in different threads or event loops)
+_vpn_lock = threading.Lock()
+_vpn_connect_lock = threading.Lock()
+
 
 def get_vpn_manager():
     """
@@ -59,25 +66,27 @@ def get_vpn_manager():
         )
         return None
     
-    # Create VPN instance if not exists
+    # Create VPN instance if not exists (double-checked so only one is ever created)
     if _vpn_instance is None:
-        try:
-            _vpn_instance = VPNRequests(
-                config_path=config.vpn_config_path,
-                auto_connect=True  # Auto-connect when making requests
-            )
-            logger.info(
-                "Initialized VPN manager",
-                config_path=config.vpn_config_path,
-                auto_connect=True
-            )
-        except Exception as e:
-            logger.error(
-                "Failed to initialize VPN manager",
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            return None
+        with _vpn_lock:
+            if _vpn_instance is None:
+                try:
+                    _vpn_instance = VPNRequests(
+                        config_path=config.vpn_config_path,
+                        auto_connect=True  # Auto-connect when making requests
+                    )
+                    logger.info(
+                        "Initialized VPN manager",
+                        config_path=config.vpn_config_path,
+                        auto_connect=True
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to initialize VPN manager",
+                        error=str(e),
+                        error_type=type(e).__name__
+                    )
+                    return None
     
     return _vpn_instance
 
@@ -97,25 +106,34 @@ def ensure_vpn_connected():
     IP ranges will be routed through the VPN.
     """
     vpn = get_vpn_manager()
-    if vpn and not vpn.is_connected():
+    if not vpn or vpn.is_connected():
+        return
+    
+    # Only one caller brings the interface up; others wait and re-check
+    with _vpn_connect_lock:
+        if vpn.is_connected():
+            return
+        
         try:
             success = vpn.connect()
             if success:
                 logger.info("VPN connected for scraping")
-                # Verify routing by checking IP (optional, but helpful for debugging)
-                try:
-                    current_ip = vpn.get_ip()
-                    if current_ip:
-                        logger.info(
-                            "VPN routing verified",
-                            current_ip=current_ip,
-                            note="All system traffic (including AsyncPRAW) should now route through VPN"
+                # Verify routing by checking IP (an extra request to a public IP
+                # service, so only when debugging)
+                if logger.is_enabled_for(logging.DEBUG):
+                    try:
+                        current_ip = vpn.get_ip()
+                        if current_ip:
+                            logger.debug(
+                                "VPN routing verified",
+                                current_ip=current_ip,
+                                note="All system traffic (including AsyncPRAW) should now route through VPN"
+                            )
+                    except Exception as ip_check_error:
+                        logger.debug(
+                            "Could not verify VPN IP (non-critical)",
+                            error=str(ip_check_error)
                         )
-                except Exception as ip_check_error:
-                    logger.debug(
-                        "Could not verify VPN IP (non-critical)",
-                        error=str(ip_check_error)
-                    )
             else:
                 logger.warning("VPN connection failed, continuing without VPN")
         except Exception as e:
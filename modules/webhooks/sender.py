@@ -4,18 +4,35 @@ Sends HTTP POST requests to configured webhook URLs with signature verification.
 """
 
 import asyncio
-from typing import Dict, Any, Optional
-import json
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urlparse
 import hmac
 import hashlib
 
 import httpx
+import orjson
 
 from core.logger import get_logger
 from core.config import get_config
 
 logger = get_logger(__name__)
 
+# Payloads larger than this are signed in a worker thread so hashing does not
+# hold up the event loop (smaller ones are cheaper to sign inline)
+SIGN_IN_EXECUTOR_BYTES = 1024 * 1024
+
+# Maximum queued webhooks a host's worker sends concurrently
+WEBHOOK_BATCH_SIZE = 16
+
+# Maximum in-flight requests per webhook host, so one slow host cannot hold
+# most of the connection pool
+WEBHOOK_HOST_CONCURRENCY = 4
+
+# Seconds allowed to connect to a webhook host (the rest of the request
+# timeout is allowed for the response)
+WEBHOOK_CONNECT_TIMEOUT = 3.0
+
 
 class WebhookSender:
     """Sends webhook notifications."""
@@ -25,10 +42,71 @@ class WebhookSender:
         Initialize webhook sender.
         
         Args:
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (connect plus read)
         """
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        
+        # HTTP/2 lets bursts of webhooks to the same host share one connection
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            logger.warning("h2 not installed, sending webhooks over HTTP/1.1. Install httpx[http2] for HTTP/2 support.")
+            http2 = False
+        
+        self.client = httpx.AsyncClient(
+            http2=http2,
+            # Fail fast on unreachable hosts and on pool exhaustion instead of
+            # letting every phase wait the full timeout
+            timeout=httpx.Timeout(
+                connect=WEBHOOK_CONNECT_TIMEOUT,
+                read=max(timeout - WEBHOOK_CONNECT_TIMEOUT, 1.0),
+                write=WEBHOOK_CONNECT_TIMEOUT,
+                pool=1.0
+            ),
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=30
+            )
+        )
+        
+        # Keyed HMAC copied per request, so the secret is only processed once
+        self._hmac_secret: Optional[str] = None
+        self._hmac_template: Optional[hmac.HMAC] = None
+        
+        # Per-host queues of (webhook_url, payload, sent future), drained in
+        # batches by one worker each
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        
+        # Unsent lead webhooks by keyword search ID, so a job's completion
+        # waits only for its own leads
+        self._pending: Dict[str, Set[asyncio.Future]] = {}
+        
+        # Per-host limit on in-flight requests
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(WEBHOOK_HOST_CONCURRENCY)
+        )
+    
+    def _sign(self, secret: str, payload_bytes: bytes) -> str:
+        """
+        Compute the HMAC-SHA256 signature of a payload.
+        
+        Args:
+            secret: Webhook secret
+            payload_bytes: Exact request body
+            
+        Returns:
+            Hex digest signature
+        """
+        if self._hmac_template is None or self._hmac_secret != secret:
+            self._hmac_template = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+            self._hmac_secret = secret
+        
+        mac = self._hmac_template.copy()
+        mac.update(payload_bytes)
+        return mac.hexdigest()
     
     async def send_lead_created(
         self,
@@ -38,7 +116,10 @@ class WebhookSender:
         keyword_search_name: str
     ) -> bool:
         """
-        Send webhook notification when a lead is created.
+        Queue webhook notification when a lead is created.
+        
+        Lead webhooks are sent in the background, batched per webhook host,
+        so callers storing many leads do not wait on each round-trip.
         
         Args:
             webhook_url: Webhook URL to send to
@@ -47,7 +128,7 @@ class WebhookSender:
             keyword_search_name: Keyword search name
             
         Returns:
-            True if successful, False otherwise
+            True once the notification is queued
         """
         payload = {
             "event": "lead.created",
@@ -70,7 +151,8 @@ class WebhookSender:
             }
         }
         
-        return await self._send(webhook_url, payload)
+        await self._enqueue(webhook_url, payload, keyword_search_id)
+        return True
     
     async def send_job_completed(
         self,
@@ -106,6 +188,8 @@ class WebhookSender:
             }
         }
         
+        # Deliver after this job's queued lead notifications
+        await self.flush(keyword_search_id=keyword_search_id)
         return await self._send(webhook_url, payload)
     
     async def send_job_failed(
@@ -137,8 +221,80 @@ class WebhookSender:
             "error": error
         }
         
+        # Deliver after this job's queued lead notifications
+        await self.flush(keyword_search_id=keyword_search_id)
         return await self._send(webhook_url, payload)
     
+    async def _enqueue(self, webhook_url: str, payload: Dict[str, Any], keyword_search_id: str) -> None:
+        """Queue a webhook for its host's worker, starting the worker if needed."""
+        host = urlparse(webhook_url).netloc
+        queue = self._queues.get(host)
+        if queue is None:
+            queue = self._queues[host] = asyncio.Queue()
+        
+        worker = self._workers.get(host)
+        if worker is None or worker.done():
+            self._workers[host] = asyncio.create_task(self._drain(queue))
+        
+        sent = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(keyword_search_id, set()).add(sent)
+        sent.add_done_callback(lambda future: self._discard_pending(keyword_search_id, future))
+        
+        await queue.put((webhook_url, payload, sent))
+    
+    def _discard_pending(self, keyword_search_id: str, sent: asyncio.Future) -> None:
+        """Forget a sent lead webhook, dropping the search's entry once none are left."""
+        pending = self._pending.get(keyword_search_id)
+        if pending is not None:
+            pending.discard(sent)
+            if not pending:
+                del self._pending[keyword_search_id]
+    
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """Send queued webhooks, up to WEBHOOK_BATCH_SIZE concurrently."""
+        while True:
+            batch: List[Tuple[str, Dict[str, Any], asyncio.Future]] = [await queue.get()]
+            while len(batch) < WEBHOOK_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            
+            try:
+                await asyncio.gather(*(self._send_queued(*item) for item in batch))
+            finally:
+                for _, _, sent in batch:
+                    if not sent.done():
+                        sent.cancel()
+                    queue.task_done()
+    
+    async def _send_queued(self, webhook_url: str, payload: Dict[str, Any], sent: asyncio.Future) -> None:
+        """Send a queued webhook and resolve its future as soon as it is done."""
+        # _send logs and swallows its own errors
+        result = await self._send(webhook_url, payload)
+        if not sent.done():
+            sent.set_result(result)
+    
+    async def flush(self, webhook_url: Optional[str] = None, keyword_search_id: Optional[str] = None) -> None:
+        """
+        Wait until queued webhooks are sent.
+        
+        Args:
+            webhook_url: Only wait for this URL's host (all hosts if None)
+            keyword_search_id: Only wait for this keyword search's lead webhooks
+        """
+        if keyword_search_id is not None:
+            pending = self._pending.get(keyword_search_id)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            return
+        
+        if webhook_url is None:
+            queues = list(self._queues.values())
+        else:
+            queue = self._queues.get(urlparse(webhook_url).netloc)
+            queues = [queue] if queue is not None else []
+        
+        for queue in queues:
+            await queue.join()
+    
     async def _send(self, webhook_url: str, payload: Dict[str, Any]) -> bool:
         """
         Send webhook request with optional signature.
@@ -154,9 +310,8 @@ class WebhookSender:
         webhook_event_type = payload.get("event")
         
         try:
-            # Serialize payload to JSON bytes for signature calculation
-            payload_json = json.dumps(payload, sort_keys=True, separators=(',', ':'))
-            payload_bytes = payload_json.encode('utf-8')
+            # Serialize payload to compact, key-sorted JSON bytes for signature calculation
+            payload_bytes = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
             
             # Build headers
             headers = {"Content-Type": "application/json"}
@@ -164,22 +319,24 @@ class WebhookSender:
             # Add signature if webhook secret is configured
             config = get_config()
             if config.webhook_secret:
-                signature = hmac.new(
-                    config.webhook_secret.encode('utf-8'),
-                    payload_bytes,
-                    hashlib.sha256
-                ).hexdigest()
+                if len(payload_bytes) > SIGN_IN_EXECUTOR_BYTES:
+                    signature = await asyncio.get_running_loop().run_in_executor(
+                        None, self._sign, config.webhook_secret, payload_bytes
+                    )
+                else:
+                    signature = self._sign(config.webhook_secret, payload_bytes)
                 headers["X-Rixly-Signature"] = signature
                 logger.debug("Webhook signature generated", webhook_event=webhook_event_type)
             else:
                 logger.debug("Webhook secret not configured - sending without signature", webhook_event=webhook_event_type)
             
             # Send webhook request
-            response = await self.client.post(
-                webhook_url,
-                content=payload_bytes,  # Send raw bytes to ensure signature matches
-                headers=headers
-            )
+            async with self._host_semaphores[urlparse(webhook_url).netloc]:
+                response = await self.client.post(
+                    webhook_url,
+                    content=payload_bytes,  # Send raw bytes to ensure signature matches
+                    headers=headers
+                )
             response.raise_for_status()
             
             logger.info("Webhook sent successfully", url=webhook_url, webhook_event=webhook_event_type)
@@ -193,7 +350,11 @@ class WebhookSender:
             return False
     
     async def close(self):
-        """Close HTTP client."""
+        """Send queued webhooks, stop the workers and close the HTTP client."""
+        await self.flush()
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
         await self.client.aclose()
 
 
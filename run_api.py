@@ -24,13 +24,25 @@ if __name__ == "__main__":
         print(f"❌ Configuration error: {e}")
         sys.exit(1)
     
-    uvicorn.run(
-        "api.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=not config.is_production,  # Enable reload in development
-        reload_dirs=["/app"] if not config.is_production else [],  # Watch entire app directory
-        reload_includes=["*.py"],  # Watch Python files
-        log_level=config.log_level.lower()
-    )
+    if config.is_production:
+        # Production: no file watching; optionally several worker processes.
+        # uvicorn[standard] picks uvloop and httptools automatically.
+        uvicorn.run(
+            "api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=config.api_workers,
+            log_level=config.log_level.lower()
+        )
+    else:
+        uvicorn.run(
+            "api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,  # Enable reload in development
+            reload_dirs=["/app"],  # Watch entire app directory
+            reload_includes=["*.py"],  # Watch Python files
+            reload_excludes=["*/logs/*", "*/.venv/*", "*/__pycache__/*", "*/alembic/versions/*"],
+            log_level=config.log_level.lower()
+        )
 
@@ -5,13 +5,16 @@ This script helps create migrations from model changes.
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from alembic.util.exc import CommandError
+
 from core.config import get_config
 from core.logger import setup_logging, get_logger
 
@@ -23,21 +26,20 @@ def create_migration(message: str):
     Args:
         message: Migration description message
     """
-    logger = get_logger(__name__)
     config = get_config()
     
     # Setup logging
     setup_logging(log_level=config.log_level, log_file=config.log_file)
+    logger = get_logger(__name__)
     
     logger.info("Creating new Alembic migration", message=message)
     
-    # Run alembic revision with autogenerate
+    # Run alembic revision with autogenerate in-process (no CLI subprocess,
+    # so the interpreter and model imports are not paid for twice)
     try:
-        result = subprocess.run(
-            ["alembic", "revision", "--autogenerate", "-m", message],
-            cwd=project_root,
-            check=True
-        )
+        alembic_cfg = AlembicConfig(str(project_root / "alembic.ini"))
+        alembic_cfg.set_main_option("script_location", str(project_root / "alembic"))
+        command.revision(alembic_cfg, message=message, autogenerate=True)
         
         logger.info("Migration created successfully", message=message)
         print(f"\n✅ Migration created successfully!")
@@ -49,12 +51,8 @@ def create_migration(message: str):
         
         return True
         
-    except subprocess.CalledProcessError as e:
-        logger.error(
-            "Failed to create migration",
-            returncode=e.returncode,
-            stderr=e.stderr if e.stderr else None
-        )
+    except CommandError as e:
+        logger.error("Failed to create migration", error=str(e))
         print(f"\n❌ Failed to create migration")
         print(f"   Error: {e}")
         sys.exit(1)
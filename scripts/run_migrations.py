@@ -4,60 +4,122 @@ Run Alembic migrations automatically.
 This script is called during Docker container startup.
 """
 
+import logging
+import random
 import sys
 import time
 from pathlib import Path
+from typing import Optional, Tuple
+
+from sqlalchemy import create_engine, pool, text
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from alembic.util.exc import CommandError
+
 from core.config import get_config
 from core.logger import setup_logging, get_logger
-from modules.database.storage import LeadStorage
 
+# Seconds each database probe may spend connecting (libpq's minimum is 2)
+PROBE_CONNECT_TIMEOUT = 2
 
-def wait_for_database(max_retries: int = 30, retry_delay: int = 2):
+
+def wait_for_database(total_timeout: float = 60.0, base_delay: float = 0.1, max_delay: float = 5.0):
     """
     Wait for database to be ready.
     
+    Retries use capped exponential backoff with jitter, so a database that is
+    already up is detected quickly and replicas starting together do not
+    probe in lockstep.
+    
     Args:
-        max_retries: Maximum number of retry attempts
-        retry_delay: Delay between retries in seconds
+        total_timeout: Maximum total seconds to wait
+        base_delay: Delay after the first failed attempt in seconds
+        max_delay: Maximum delay between attempts in seconds
     """
     logger = get_logger(__name__)
+    config = get_config()
+    database_url = config.database_url or config.database_url_from_parts
+    
+    # Build the engine once; each attempt only opens a connection, with a short
+    # connect timeout so an unreachable host does not eat the retry budget
+    connect_args = {"connect_timeout": PROBE_CONNECT_TIMEOUT} if database_url.startswith("postgres") else {}
+    engine = create_engine(database_url, poolclass=pool.NullPool, connect_args=connect_args)
+    deadline = time.monotonic() + total_timeout
+    attempt = 0
     
-    for attempt in range(1, max_retries + 1):
+    while True:
+        attempt += 1
         try:
-            storage = LeadStorage()
-            # Try to connect
-            storage.get_session().close()
+            # Try to connect (a new Session alone would not touch the database)
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
             logger.info("Database is ready")
             return True
         except Exception as e:
-            if attempt < max_retries:
-                logger.info(
-                    f"Waiting for database... (attempt {attempt}/{max_retries})",
-                    error=str(e)
-                )
-                time.sleep(retry_delay)
-            else:
-                logger.error("Database connection failed after all retries", error=str(e))
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.error("Database connection failed after all retries", attempts=attempt, error=str(e))
+                engine.dispose()
                 return False
+            
+            logger.info(
+                f"Waiting for database... (attempt {attempt})",
+                retry_in=round(min(delay, remaining), 2),
+                error=str(e)
+            )
+            time.sleep(min(delay, remaining))
+
+
+def get_revisions(alembic_cfg: AlembicConfig, database_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the database's current revision and the migration scripts' head revision.
     
-    return False
+    Args:
+        alembic_cfg: Alembic configuration
+        database_url: Database URL
+        
+    Returns:
+        Tuple of (current_revision, head_revision)
+    """
+    head_revision = ScriptDirectory.from_config(alembic_cfg).get_current_head()
+    
+    engine = create_engine(database_url, poolclass=pool.NullPool)
+    try:
+        with engine.connect() as connection:
+            current_revision = MigrationContext.configure(connection).get_current_revision()
+    finally:
+        engine.dispose()
+    
+    return current_revision, head_revision
+
+
+class _MigrationLogHandler(logging.Handler):
+    """Forward Alembic's stdlib log records to the structured logger."""
+    
+    def __init__(self, logger):
+        super().__init__(level=logging.INFO)
+        self._logger = logger
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        level = "warning" if record.levelno >= logging.WARNING else "info"
+        getattr(self._logger, level)("Migration", message=record.getMessage())
 
 
 def run_migrations():
     """Run Alembic migrations."""
-    import subprocess
-    import os
-    
-    logger = get_logger(__name__)
     config = get_config()
     
     # Setup logging
     setup_logging(log_level=config.log_level, log_file=config.log_file)
+    logger = get_logger(__name__)
     
     logger.info("Starting database migrations")
     
@@ -66,47 +128,45 @@ def run_migrations():
         logger.error("Database is not ready. Exiting.")
         sys.exit(1)
     
-    # Ensure DATABASE_URL is set for Alembic
-    # Alembic reads from alembic.ini or environment
-    if config.database_url:
-        os.environ["DATABASE_URL"] = config.database_url
-    else:
-        os.environ["DATABASE_URL"] = config.database_url_from_parts
+    # Run migrations in-process; alembic/env.py reads the database URL from
+    # get_config(), and keeps the logging configured above
+    alembic_cfg = AlembicConfig(str(project_root / "alembic.ini"))
+    alembic_cfg.set_main_option("script_location", str(project_root / "alembic"))
+    alembic_cfg.attributes["configure_logger"] = False
     
-    logger.info("Database URL configured for migrations")
+    alembic_logger = logging.getLogger("alembic")
+    handler = _MigrationLogHandler(logger)
+    alembic_logger.addHandler(handler)
+    alembic_logger.setLevel(logging.INFO)
+    alembic_logger.propagate = False
     
-    # Run migrations
     try:
-        logger.info("Running Alembic migrations...")
-        result = subprocess.run(
-            ["alembic", "upgrade", "head"],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        # Nothing to do if the database is already at head (the usual case on restarts)
+        try:
+            current_revision, head_revision = get_revisions(
+                alembic_cfg, config.database_url or config.database_url_from_parts
+            )
+        except Exception as e:
+            logger.warning("Could not check current migration revision", error=str(e))
+        else:
+            if current_revision == head_revision:
+                logger.info("Database is at head revision, skipping migrations", revision=head_revision)
+                return True
         
+        logger.info("Running Alembic migrations...")
+        command.upgrade(alembic_cfg, "head")
         logger.info("Migrations completed successfully")
-        if result.stdout:
-            # Log migration output (but mask sensitive data)
-            output_lines = result.stdout.strip().split('\n')
-            for line in output_lines:
-                if line.strip():
-                    logger.info("Migration", message=line)
-        
         return True
         
-    except subprocess.CalledProcessError as e:
-        logger.error(
-            "Migration failed",
-            returncode=e.returncode,
-            stdout=e.stdout if e.stdout else None,
-            stderr=e.stderr if e.stderr else None
-        )
+    except CommandError as e:
+        logger.error("Migration failed", error=str(e))
         sys.exit(1)
     except Exception as e:
         logger.error("Unexpected error during migrations", error=str(e))
         sys.exit(1)
+    finally:
+        alembic_logger.removeHandler(handler)
+        alembic_logger.propagate = True
 
 
 if __name__ == "__main__":
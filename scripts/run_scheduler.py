@@ -14,17 +14,10 @@ sys.path.insert(0, str(project_root))
 from core.config import get_config
 from core.logger import get_logger, setup_logging
 from core.env_validator import validate_and_exit
-from modules.scheduler.scheduler import RixlyScheduler
 
 logger = get_logger(__name__)
 
 
-def signal_handler(sig, frame):
-    """Handle shutdown signals."""
-    logger.info("Received shutdown signal")
-    sys.exit(0)
-
-
 async def main():
     """Main scheduler loop."""
     # Validate environment variables before starting
@@ -50,27 +43,62 @@ async def main():
         logger.warning("Scheduler is disabled in config. Exiting.")
         return
     
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Imported here so validation failures and a disabled scheduler exit
+    # without loading the database, HTTP and processing stacks
+    from modules.reddit.api_client import get_reddit_api_client
+    from modules.scheduler.scheduler import RixlyScheduler
+    from modules.webhooks.sender import get_webhook_sender
+    
+    # Open the Reddit API connection before the first scrape needs it
+    if config.reddit_client_id and config.reddit_client_secret:
+        await get_reddit_api_client().warmup()
     
     # Create and start scheduler
     scheduler = RixlyScheduler()
     scheduler.start()
     
+    # Shutdown signals set an event instead of exiting, so the cleanup below runs
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    
+    def request_shutdown():
+        # Repeated signals (e.g. an orchestrator resending SIGTERM) are ignored
+        if stop_event.is_set():
+            return
+        logger.info("Received shutdown signal")
+        stop_event.set()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, request_shutdown)
+    
     logger.info("Scheduler service started. Press Ctrl+C to stop.")
     
     try:
-        # Keep running
-        while True:
-            await asyncio.sleep(1)
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt")
+        await stop_event.wait()
     finally:
         scheduler.stop()
+        await get_reddit_api_client().close()
+        # Send queued lead webhooks before exiting
+        await get_webhook_sender().close()
         logger.info("Scheduler service stopped")
 
 
+def install_event_loop_policy():
+    """Use uvloop for the event loop when available (installed with uvicorn[standard])."""
+    # Lazy import uvloop (optional dependency)
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    install_event_loop_policy()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # Interrupted before the signal handlers were installed
+        sys.exit(130)
 
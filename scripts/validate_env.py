@@ -14,7 +14,8 @@ sys.path.insert(0, str(project_root))
 from core.env_validator import print_validation_report, validate_and_exit
 
 
-if __name__ == "__main__":
+def build_parser():
+    """Build the command-line argument parser."""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -37,8 +38,16 @@ Examples:
         action="store_true",
         help="Exit with code 1 if validation fails"
     )
+    return parser
+
+
+if __name__ == "__main__":
+    # Plain invocations (e.g. healthchecks) skip argparse entirely
+    if len(sys.argv) == 1:
+        print_validation_report(verbose=False)
+        sys.exit(0)
     
-    args = parser.parse_args()
+    args = build_parser().parse_args()
     
     print_validation_report(verbose=args.verbose)
     
@@ -0,0 +1,53 @@
+"""
+Tests for lazy log values in core.logger.
+"""
+
+import structlog
+
+from core.logger import Lazy, get_logger, setup_logging
+
+
+def _counting_lazy(calls, value):
+    """Build a Lazy value that records each evaluation in ``calls``."""
+    def build():
+        calls.append(value)
+        return value
+    return Lazy(build)
+
+
+def test_lazy_value_not_called_when_event_filtered(capsys):
+    setup_logging(log_level="WARNING", enable_file_logging=False)
+    calls = []
+    
+    get_logger("tests.logger").info("filtered event", ids=_counting_lazy(calls, [1, 2]))
+    
+    assert calls == []
+    assert "filtered event" not in capsys.readouterr().out
+
+
+def test_lazy_value_resolved_when_event_emitted(capsys):
+    setup_logging(log_level="INFO", enable_file_logging=False)
+    calls = []
+    
+    get_logger("tests.logger").info("emitted event", ids=_counting_lazy(calls, [1, 2]), kind=dict)
+    
+    output = capsys.readouterr().out
+    assert calls == [[1, 2]]
+    assert "[1, 2]" in output
+    assert "<class 'dict'>" in output  # plain callables are logged unchanged
+
+
+def test_lazy_context_value_resolved(capsys):
+    setup_logging(log_level="INFO", enable_file_logging=False)
+    calls = []
+    
+    structlog.contextvars.bind_contextvars(batch=_counting_lazy(calls, "batch-1"))
+    try:
+        get_logger("tests.logger").info("context event")
+    finally:
+        structlog.contextvars.clear_contextvars()
+    
+    output = capsys.readouterr().out
+    assert calls == ["batch-1"]
+    assert "batch-1" in output
+    assert "Lazy object" not in output